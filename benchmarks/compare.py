@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from fnmatch import fnmatch
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare two benchmark results and check for regressions.")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative change regarded as a regression (default: 0.1)"
+    )
+    parser.add_argument(
+        "--include", nargs="+", default=["*"], help="patterns of metrics to check for regressions (default: all)"
+    )
+
+    return parser.parse_args()
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as input_file:
+        return json.load(input_file)["metrics"]
+
+
+def compare(baseline: dict, current: dict, threshold: float, include: list[str]) -> list[str]:
+    regressions = []
+    for name, metric in baseline.items():
+        if name not in current or metric["value"] == 0:
+            continue
+
+        change = (current[name]["value"] - metric["value"]) / metric["value"]
+        checked = any(fnmatch(name, pattern) for pattern in include)
+        # A positive change is worse for lower-is-better metrics, and better for higher-is-better metrics
+        regressed = checked and (-change if metric["higher_is_better"] else change) > threshold
+        if regressed:
+            regressions.append(name)
+
+        print(
+            f"{name:<40} {metric['value']:>12.3f} -> {current[name]['value']:>12.3f} {metric['unit']:<12} "
+            f"{change:+8.1%}{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    regressions = compare(load(arguments.baseline), load(arguments.current), arguments.threshold, arguments.include)
+    if regressions:
+        sys.stderr.write(f"{len(regressions)} regression(s) over {arguments.threshold:.0%}: {', '.join(regressions)}\n")
+        sys.exit(1)
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+from mecab import AsyncMeCab, MeCab, __version__
+
+benchmarks_path = Path(__file__).parent.absolute()
+corpus_path = benchmarks_path.parent / "tests" / "corpus.txt"
+
+# Prints the time to import mecab, to create the first MeCab instance and to parse the first sentence
+# in a fresh interpreter. The instance is lazy if the first argument is "lazy".
+COLD_CONSTRUCTION_CODE = """
+import sys, time
+start = time.perf_counter()
+from mecab import MeCab
+imported = time.perf_counter()
+mecab = MeCab(lazy=sys.argv[1] == "lazy")
+constructed = time.perf_counter()
+mecab.parse("아버지가방에들어가신다")
+parsed = time.perf_counter()
+print(imported - start, constructed - start, parsed - constructed)
+"""
+
+# Prints the peak resident set size in bytes after analyzing the corpus in a fresh interpreter
+PEAK_MEMORY_CODE = """
+import resource, sys
+from mecab import MeCab
+lines = open(sys.argv[1], encoding="utf-8").read().splitlines()
+mecab = MeCab()
+for _ in range(int(sys.argv[2])):
+    mecab.parse_batch(lines)
+    mecab.parse(" ".join(lines))
+maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(maxrss if sys.platform == "darwin" else maxrss * 1024)
+"""
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run benchmarks of python-mecab-ko and store the results as JSON.")
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--quick", action="store_true", help="run fewer iterations")
+
+    return parser.parse_args()
+
+
+def readlines(path: Path) -> list[str]:
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def metric(value: float, unit: str, higher_is_better: bool = False) -> dict:
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    samples = sorted(samples)
+    index = min(len(samples) - 1, max(0, round(percent / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+def measure(function: Callable[[], object], number_of_iterations: int) -> list[float]:
+    function()  # Warm up
+    gc.collect()
+
+    samples = []
+    for _ in range(number_of_iterations):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def measure_cold_construction(mode: str, number_of_iterations: int) -> list[float]:
+    samples = []
+    for _ in range(number_of_iterations):
+        arguments = [sys.executable, "-c", COLD_CONSTRUCTION_CODE, mode]
+        output = subprocess.run(arguments, capture_output=True, check=True)
+        samples.append([float(value) for value in output.stdout.split()])
+
+    # Medians of import, construction and first parse times
+    return [statistics.median(values) for values in zip(*samples)]
+
+
+def benchmark_construction(number_of_iterations: int) -> dict:
+    import_seconds, cold_seconds, first_parse_seconds = measure_cold_construction("eager", number_of_iterations)
+    _, lazy_seconds, lazy_first_parse_seconds = measure_cold_construction("lazy", number_of_iterations)
+
+    MeCab()  # Load dictionaries
+    warm_samples = measure(MeCab, number_of_iterations * 10)
+
+    return {
+        "construction.import": metric(import_seconds * 1000, "ms"),
+        "construction.cold": metric(cold_seconds * 1000, "ms"),
+        "construction.first_parse": metric(first_parse_seconds * 1000, "ms"),
+        "construction.lazy.cold": metric(lazy_seconds * 1000, "ms"),
+        "construction.lazy.first_parse": metric(lazy_first_parse_seconds * 1000, "ms"),
+        "construction.warm": metric(statistics.median(warm_samples) * 1000, "ms"),
+    }
+
+
+def benchmark_latency(mecab: MeCab, inputs: dict[str, tuple[str, int]]) -> dict:
+    results = {}
+    for method in ["parse", "pos", "morphs", "nouns"]:
+        function = getattr(mecab, method)
+        for name, (sentence, number_of_iterations) in inputs.items():
+            samples = measure(lambda: function(sentence), number_of_iterations)
+            for percent in [50, 90, 99]:
+                results[f"latency.{method}.{name}.p{percent}"] = metric(percentile(samples, percent) * 1000, "ms")
+    return results
+
+
+def benchmark_throughput(mecab: MeCab, sentences: list[str], number_of_iterations: int) -> dict:
+    number_of_bytes = sum(len(sentence.encode("utf-8")) for sentence in sentences)
+
+    results = {}
+    number_of_threads = 1
+    while number_of_threads <= (os.cpu_count() or 1):
+        seconds = statistics.median(
+            measure(lambda: mecab.parse_batch(sentences, number_of_threads=number_of_threads), number_of_iterations)
+        )
+        name = "batch" if number_of_threads == 1 else f"threads.{number_of_threads}"
+        results[f"throughput.{name}.sentences"] = metric(len(sentences) / seconds, "sentences/s", True)
+        results[f"throughput.{name}.bytes"] = metric(number_of_bytes / (1024 * 1024) / seconds, "MB/s", True)
+        number_of_threads *= 2
+    return results
+
+
+def benchmark_scaling(mecab: MeCab, sentences: list[str], number_of_iterations: int) -> dict:
+    # Speedup of calling parse() from multiple Python threads, which requires the GIL to be released during analysis
+    def parse_from_threads(number_of_threads: int):
+        with ThreadPoolExecutor(max_workers=number_of_threads) as executor:
+            for _ in executor.map(mecab.parse, sentences * number_of_threads):
+                pass
+
+    results = {}
+    number_of_threads = 2
+    single_threaded = statistics.median(measure(lambda: parse_from_threads(1), number_of_iterations))
+    while number_of_threads <= (os.cpu_count() or 1):
+        seconds = statistics.median(measure(lambda: parse_from_threads(number_of_threads), number_of_iterations))
+        results[f"scaling.threads.{number_of_threads}"] = metric(
+            number_of_threads * single_threaded / seconds, "x", True
+        )
+        number_of_threads *= 2
+    return results
+
+
+async def measure_loop_lag(parse: Callable[[str], Any], sentences: list[str], number_of_callers: int) -> list[float]:
+    # Lag of the event loop, which is how late a task wakes up from its scheduled time, while callers are parsing
+    interval = 0.001
+    samples = []
+    stopped = False
+
+    async def tick():
+        while not stopped:
+            scheduled = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            samples.append(max(time.perf_counter() - scheduled, 0.0))
+
+    async def call(sentences: list[str]):
+        for sentence in sentences:
+            result = parse(sentence)
+            if asyncio.iscoroutine(result):
+                await result
+            else:
+                await asyncio.sleep(0)  # A synchronous caller still yields between sentences
+
+    ticker = asyncio.ensure_future(tick())
+    await asyncio.gather(*(call(sentences[index::number_of_callers]) for index in range(number_of_callers)))
+    stopped = True
+    await ticker
+    return samples
+
+
+def benchmark_event_loop(sentences: list[str], number_of_callers: int) -> dict:
+    async def run_async() -> list[float]:
+        async with AsyncMeCab() as mecab:
+            await mecab.parse(sentences[0])  # Warm up
+            return await measure_loop_lag(mecab.parse, sentences, number_of_callers)
+
+    async def run_sync() -> list[float]:
+        return await measure_loop_lag(MeCab().parse, sentences, number_of_callers)
+
+    results = {}
+    for name, run in [("async", run_async), ("sync", run_sync)]:
+        samples = asyncio.run(run())
+        for percent in [50, 99]:
+            results[f"event_loop.lag.{name}.p{percent}"] = metric(percentile(samples, percent) * 1000, "ms")
+    return results
+
+
+def benchmark_memory(number_of_iterations: int) -> dict:
+    if sys.platform == "win32":
+        return {}
+
+    arguments = [sys.executable, "-c", PEAK_MEMORY_CODE, str(corpus_path), str(number_of_iterations)]
+    output = subprocess.run(arguments, capture_output=True, check=True)
+    return {"memory.peak": metric(int(output.stdout) / (1024 * 1024), "MB")}
+
+
+def run(quick: bool) -> dict:
+    scale = 1 if quick else 10
+    lines = readlines(corpus_path)
+    mecab = MeCab()
+
+    inputs = {
+        "short": ("아버지가방에들어가신다", 100 * scale),
+        "medium": (lines[0], 20 * scale),
+        "long": (" ".join(lines * 4), 5 * scale),
+    }
+
+    metrics = {}
+    sys.stderr.write("Benchmarking construction...\n")
+    metrics.update(benchmark_construction(3 if quick else 10))
+    sys.stderr.write("Benchmarking latency...\n")
+    metrics.update(benchmark_latency(mecab, inputs))
+    sys.stderr.write("Benchmarking throughput...\n")
+    metrics.update(benchmark_throughput(mecab, lines * 10, 2 * scale))
+    sys.stderr.write("Benchmarking scaling...\n")
+    metrics.update(benchmark_scaling(mecab, lines, scale))
+    sys.stderr.write("Benchmarking event loop...\n")
+    metrics.update(benchmark_event_loop(lines * scale, number_of_callers=64))
+    sys.stderr.write("Benchmarking memory...\n")
+    metrics.update(benchmark_memory(scale))
+
+    return {
+        "metadata": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "metrics": metrics,
+    }
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    results = run(arguments.quick)
+    with open(arguments.output, "w", encoding="utf-8") as output_file:
+        json.dump(results, output_file, indent=2)
+        output_file.write("\n")
+
+    for name, value in results["metrics"].items():
+        print(f"{name:<40} {value['value']:>12.3f} {value['unit']}")
@@ -1,14 +1,54 @@
+import importlib
+
+from .cache import CacheInfo, FeatureCache, ResultCache, feature_cache
+from .instrumentation import Stats
 from .mecab import MeCab, MeCabError, mecabrc_path
-from .types import Dictionary, Feature, Morpheme, Span
+from .model import ModelCache, model_cache
+from .registry import PosRegistry, pos_registry
+from .types import Candidate, Columns, Constraint, Dictionary, Feature, LatticeGraph, Morpheme, Span
 
 __version__ = "1.3.7"
 
 __all__ = [
     "MeCab",
+    "AsyncMeCab",
     "Morpheme",
     "Span",
     "Feature",
     "Dictionary",
+    "Candidate",
+    "Constraint",
+    "Columns",
+    "LatticeGraph",
+    "Stats",
     "MeCabError",
     "mecabrc_path",
+    "ModelCache",
+    "model_cache",
+    "PosRegistry",
+    "pos_registry",
+    "ResultCache",
+    "CacheInfo",
+    "FeatureCache",
+    "feature_cache",
+    "build_user_dictionary",
 ]
+
+# Imported on first access, as they import modules which take long to import (e.g. asyncio)
+_lazy_attributes = {
+    "AsyncMeCab": "aio",
+    "build_user_dictionary": "user_dictionary",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(f".{_lazy_attributes[name]}", __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes))
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import argparse
+import json
 import sys
-from typing import Optional
-
-import mecab_ko_dic
+import time
+from itertools import islice
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterator, Optional, TextIO
 
 import _mecab
-from mecab import mecabrc_path
+from mecab import Columns, MeCab, mecabrc_path
+
+if TYPE_CHECKING:
+    from mecab.parallel import Throughput
 
 _rcfile_option = ["--rcfile", str(mecabrc_path)]
-_dicdir_option = ["--dicdir", str(mecab_ko_dic.dictionary_path)]
-_model_option = ["--model", str(mecab_ko_dic.model_path)]
+
+
+# Paths of the dictionary are resolved only by the tasks using them
+def _dicdir_option() -> list[str]:
+    import mecab_ko_dic
+
+    return ["--dicdir", str(mecab_ko_dic.dictionary_path)]
+
+
+def _model_option() -> list[str]:
+    import mecab_ko_dic
+
+    return ["--model", str(mecab_ko_dic.model_path)]
 
 
 def parse_arguments() -> tuple[Optional[str], list[str]]:
@@ -18,7 +34,7 @@ def parse_arguments() -> tuple[Optional[str], list[str]]:
     if not arguments:
         return None, []
 
-    tasks = {"dict-index", "dict-gen", "cost-train"}
+    tasks = {"dict-index", "dict-gen", "cost-train", "tokenize"}
     if arguments[0] in tasks:
         return arguments[0], arguments[1:]
 
@@ -26,19 +42,133 @@ def parse_arguments() -> tuple[Optional[str], list[str]]:
 
 
 def mecab_dict_index(arguments: list[str]) -> int:
-    return _mecab.cli.dict_index([*_dicdir_option, *_model_option, *arguments])
+    return _mecab.cli.dict_index([*_dicdir_option(), *_model_option(), *arguments])
 
 
 def mecab_dict_gen(arguments: list[str]) -> int:
-    return _mecab.cli.dict_gen([*_dicdir_option, *_model_option, *arguments])
+    return _mecab.cli.dict_gen([*_dicdir_option(), *_model_option(), *arguments])
 
 
 def mecab_cost_train(arguments: list[str]) -> int:
-    return _mecab.cli.cost_train([*_dicdir_option, *arguments])
+    return _mecab.cli.cost_train([*_dicdir_option(), *arguments])
+
+
+def _format_jsonl(columns: Columns) -> Iterator[str]:
+    surfaces = [columns.surface(index) for index in range(len(columns.starts))]
+    pos_tags = [columns.pos(index) for index in range(len(columns.starts))]
+    offsets = columns.sentence_offsets.tolist()
+    for start, end in zip(offsets, offsets[1:]):
+        yield json.dumps([[surfaces[i], pos_tags[i]] for i in range(start, end)], ensure_ascii=False) + "\n"
+
+
+def _format_tsv(columns: Columns) -> Iterator[str]:
+    offsets = columns.sentence_offsets.tolist()
+    for start, end in zip(offsets, offsets[1:]):
+        yield "".join(f"{columns.surface(i)}\t{columns.pos(i)}\n" for i in range(start, end)) + "\n"
+
+
+def _format_columnar(columns: Columns) -> Iterator[str]:
+    chunk = {
+        "sentence_offsets": columns.sentence_offsets.tolist(),
+        "starts": columns.starts.tolist(),
+        "ends": columns.ends.tolist(),
+        "pos_ids": columns.pos_ids.tolist(),
+        "pos_tags": columns.pos_tags,
+        "surfaces": [columns.surface(index) for index in range(len(columns.starts))],
+    }
+    yield json.dumps(chunk, ensure_ascii=False) + "\n"
+
+
+_formatters: dict[str, Callable[[Columns], Iterator[str]]] = {
+    "jsonl": _format_jsonl,
+    "tsv": _format_tsv,
+    "columnar": _format_columnar,
+}
+
+
+def _read_lines(files: list[BinaryIO], counter: list[int]) -> Iterator[str]:
+    for file in files:
+        for line in file:
+            counter[0] += len(line)
+            yield line.decode("utf-8").rstrip("\r\n")
+
+
+def _tokenize_with_threads(
+    sentences: Iterator[str], threads: int, chunk_size: int, mecab_arguments: dict
+) -> Iterator[Columns]:
+    tagger = MeCab(**mecab_arguments)
+    while True:
+        chunk = list(islice(sentences, chunk_size))
+        if not chunk:
+            return
+        yield tagger.parse_columnar(chunk, number_of_threads=threads)
+
+
+def _write_summary(throughput: Throughput, file: TextIO):
+    print(
+        f"{throughput.sentences} sentences, {throughput.bytes / (1024 * 1024):.2f} MB in {throughput.seconds:.2f}s "
+        f"({throughput.sentences_per_second:.0f} sentences/s, {throughput.megabytes_per_second:.2f} MB/s)",
+        file=file,
+    )
+
+
+def mecab_tokenize(arguments: list[str]) -> int:
+    from mecab.parallel import Throughput, tokenize_corpus
+
+    parser = argparse.ArgumentParser(
+        prog="python -m mecab tokenize",
+        description="Tokenize UTF-8 text with a sentence per line, keeping the order of the input.",
+    )
+    parser.add_argument("files", nargs="*", default=["-"], help="input files (default: standard input)")
+    parser.add_argument("-f", "--format", choices=sorted(_formatters), default="jsonl", help="output format")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: standard output)")
+    parser.add_argument("-t", "--threads", type=int, default=1, help="number of threads")
+    parser.add_argument("-p", "--processes", type=int, default=1, help="number of processes")
+    parser.add_argument("-c", "--chunk-size", type=int, default=1024, help="number of sentences in a chunk")
+    parser.add_argument("-d", "--dicdir", help="path to the system dictionary")
+    parser.add_argument("-u", "--userdic", action="append", help="path to a user dictionary")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not print a summary")
+    options = parser.parse_args(arguments)
+
+    if options.threads > 1 and options.processes > 1:
+        parser.error("--threads and --processes cannot be used together")
+
+    mecab_arguments = {"dictionary_path": options.dicdir, "user_dictionary_path": options.userdic}
+    files = [sys.stdin.buffer if path == "-" else open(path, "rb") for path in options.files]
+    output = (
+        open(sys.stdout.fileno(), "w", encoding="utf-8", buffering=1024 * 1024, closefd=False)
+        if options.output == "-"
+        else open(options.output, "w", encoding="utf-8", buffering=1024 * 1024)
+    )
+
+    counter = [0]
+    number_of_sentences = 0
+    start = time.perf_counter()
+    try:
+        sentences = _read_lines(files, counter)
+        if options.processes > 1:
+            chunks = tokenize_corpus(sentences, options.processes, options.chunk_size, **mecab_arguments)
+        else:
+            chunks = _tokenize_with_threads(sentences, options.threads, options.chunk_size, mecab_arguments)
+
+        format = _formatters[options.format]
+        for columns in chunks:
+            output.write("".join(format(columns)))
+            number_of_sentences += len(columns.sentence_offsets) - 1
+    finally:
+        output.close()
+        for file in files:
+            if file is not sys.stdin.buffer:
+                file.close()
+
+    if not options.quiet:
+        _write_summary(Throughput(number_of_sentences, counter[0], time.perf_counter() - start), sys.stderr)
+
+    return 0
 
 
 def mecab(arguments: list[str]) -> int:
-    return _mecab.cli.mecab([*_rcfile_option, *_dicdir_option, *arguments])
+    return _mecab.cli.mecab([*_rcfile_option, *_dicdir_option(), *arguments])
 
 
 def main() -> int:
@@ -50,6 +180,8 @@ def main() -> int:
         return mecab_dict_gen(arguments)
     elif task == "cost-train":
         return mecab_cost_train(arguments)
+    elif task == "tokenize":
+        return mecab_tokenize(arguments)
     else:
         return mecab(arguments)
 
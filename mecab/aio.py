@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Union
+
+from mecab.mecab import MeCab, PathLike
+from mecab.types import Morpheme
+
+
+class AsyncMeCab:
+    """An asyncio interface of `MeCab`.
+
+    Concurrent requests are gathered into batches, and each batch is analyzed by a pool of worker threads
+    without holding the GIL, so the event loop is never blocked by the analysis.
+    """
+
+    def __init__(
+        self,
+        dictionary_path: Optional[PathLike] = None,
+        user_dictionary_path: Optional[Union[PathLike, list[PathLike]]] = None,
+        max_workers: int = 4,
+        max_batch_size: int = 64,
+        max_pending: int = 1024,
+    ):
+        """
+        Parameters:
+            dictionary_path: Path to the system dictionary to use. If not provided, the default mecab-ko-dic dictionary will be used.
+            user_dictionary_path: Path or list of paths to user dictionaries to use. If not provided, no user dictionaries will be used.
+            max_workers: The number of worker threads analyzing batches
+            max_batch_size: The maximum number of sentences in a batch
+            max_pending: The maximum number of sentences waiting for analysis. Further requests wait until some of them are done.
+        """
+        self._mecab = MeCab(dictionary_path=dictionary_path, user_dictionary_path=user_dictionary_path)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mecab")
+        self._max_batch_size = max_batch_size
+        self._max_pending = max_pending
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending: dict[Callable[[list[str]], list[Any]], list[tuple[str, asyncio.Future]]] = {}
+
+    async def parse(self, sentence: str) -> list[Morpheme]:
+        """Perform morpheme analysis on a given sentence. See `MeCab.parse()`."""
+        return await self._submit(self._mecab.parse_batch, sentence)
+
+    async def pos(self, sentence: str) -> list[tuple[str, str]]:
+        """Extract `(surface, part-of-speech tag)` pairs from a given sentence. See `MeCab.pos()`."""
+        return await self._submit(self._mecab.pos_batch, sentence)
+
+    async def morphs(self, sentence: str) -> list[str]:
+        """Extract morphemes from a given sentence. See `MeCab.morphs()`."""
+        return await self._submit(self._mecab.morphs_batch, sentence)
+
+    async def nouns(self, sentence: str) -> list[str]:
+        """Extract nouns from a given sentence. See `MeCab.nouns()`."""
+        return await self._submit(self._mecab.nouns_batch, sentence)
+
+    async def parse_batch(self, sentences: list[str]) -> list[list[Morpheme]]:
+        """Perform morpheme analysis on given sentences at once. See `MeCab.parse_batch()`."""
+        return await asyncio.gather(*(self.parse(sentence) for sentence in sentences))
+
+    def close(self):
+        """Shuts down the worker threads after all the submitted batches are done."""
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> AsyncMeCab:
+        return self
+
+    async def __aexit__(self, *_):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def _submit(self, parse_batch: Callable[[list[str]], list[Any]], sentence: str) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_pending)
+
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+
+            pending = self._pending.setdefault(parse_batch, [])
+            pending.append((sentence, future))
+            if len(pending) >= self._max_batch_size:
+                self._flush(parse_batch)
+            elif len(pending) == 1:
+                # Gather requests arriving in the same iteration of the event loop
+                loop.call_soon(self._flush, parse_batch)
+
+            return await future
+
+    def _flush(self, parse_batch: Callable[[list[str]], list[Any]]):
+        # Requests cancelled before being dispatched are not analyzed
+        requests = [(sentence, future) for sentence, future in self._pending.pop(parse_batch, []) if not future.done()]
+        if not requests:
+            return
+
+        sentences = [sentence for sentence, _ in requests]
+        batch = asyncio.get_running_loop().run_in_executor(self._executor, parse_batch, sentences)
+        batch.add_done_callback(lambda batch: self._resolve(requests, batch))
+
+    @staticmethod
+    def _resolve(requests: list[tuple[str, asyncio.Future]], batch: asyncio.Future):
+        if batch.cancelled():
+            for _, future in requests:
+                future.cancel()
+            return
+
+        error = batch.exception()
+        results = batch.result() if error is None else [None] * len(requests)
+        for (_, future), result in zip(requests, results):
+            if future.done():  # Cancelled while being analyzed
+                continue
+
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
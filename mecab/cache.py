@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional
+
+import _mecab
+
+
+class CacheInfo(NamedTuple):
+    """Represents statistics of a `ResultCache`
+
+    Attributes:
+        hits: The number of lookups which found a result
+        misses: The number of lookups which did not find a result
+        evictions: The number of results evicted by the size limits or expiration
+        entries: The number of cached results
+        bytes: The estimated size of cached results in bytes
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+class _Entry(NamedTuple):
+    value: tuple
+    size: int
+    expires_at: float
+
+
+def _sizeof(value: Any) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, tuple):
+        size += sum(_sizeof(item) for item in value)
+    return size
+
+
+class ResultCache:
+    """A thread-safe LRU cache of analysis results, which can be shared by `MeCab` instances.
+
+    Results are cached as tuples of immutable objects, and shared by every lookup.
+    Keys include the identity of the dictionaries, so results analyzed with different dictionaries are never mixed.
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = 10000, max_bytes: Optional[int] = None, ttl: Optional[float] = None
+    ):
+        """
+        Parameters:
+            max_entries: The maximum number of cached results. If `None`, the number is not limited.
+            max_bytes: The maximum estimated size of cached results in bytes. If `None`, the size is not limited.
+            ttl: Time in seconds until a cached result expires. If `None`, results do not expire.
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[tuple]:
+        """Returns the result cached for a given key, or `None` if it is not cached or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is not None) and (entry.expires_at < time.monotonic()):
+                self._remove(key)
+                self._evictions += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def put(self, key: Hashable, value: tuple):
+        """Caches a result for a given key, evicting the least recently used results beyond the size limits."""
+        size = _sizeof(value)
+        if (self._max_bytes is not None) and (size > self._max_bytes):
+            return
+
+        expires_at = (time.monotonic() + self._ttl) if self._ttl is not None else float("inf")
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _Entry(value, size, expires_at)
+            self._bytes += size
+
+            while ((self._max_entries is not None) and (len(self._entries) > self._max_entries)) or (
+                (self._max_bytes is not None) and (self._bytes > self._max_bytes)
+            ):
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def clear(self):
+        """Removes all the cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def info(self) -> CacheInfo:
+        """Returns statistics of the cache.
+
+        Returns:
+            A `CacheInfo` object representing a snapshot of the statistics.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, len(self._entries), self._bytes)
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class FeatureCache:
+    """A process-wide cache interning `Feature` objects and part-of-speech tags, shared by `MeCab` instances.
+
+    Morphemes of the same dictionary entry share a single `Feature` object, so that analysis results
+    kept in memory do not hold a copy of the feature for each morpheme. The cache is bounded by the number of entries,
+    and entries beyond the limit are built without being interned.
+    """
+
+    def info(self) -> CacheInfo:
+        """Returns statistics of the cache.
+
+        Returns:
+            A `CacheInfo` object representing a snapshot of the statistics.
+            `evictions` counts entries replaced because the features changed, or dropped by `resize()`.
+        """
+        return CacheInfo(*_mecab.feature_cache_info())
+
+    def resize(self, max_entries: int):
+        """Changes the maximum number of entries. If the cache holds more entries, they are removed.
+
+        Parameters:
+            max_entries: The maximum number of entries. If `0`, features are not interned.
+        """
+        _mecab.resize_feature_cache(max_entries)
+
+    def clear(self):
+        """Removes all the entries."""
+        _mecab.clear_feature_cache()
+
+    def __len__(self) -> int:
+        return self.info().entries
+
+
+feature_cache = FeatureCache()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+from typing import NamedTuple
+
+
+class Stats(NamedTuple):
+    """Represents a snapshot of statistics collected by an instrumented `MeCab`
+
+    Time is collected for each stage of the analysis:
+
+    - `lattice`: Acquiring a lattice and setting a sentence to it
+    - `analysis`: Searching the best path of the lattice
+    - `conversion`: Converting the nodes of the lattice into Python objects
+    - `batch`: Analyzing sentences at once natively, including conversion
+
+    Attributes:
+        sentences: The number of analyzed sentences
+        bytes: The number of analyzed bytes in UTF-8
+        nodes: The number of morphemes in the best paths
+        unknown_nodes: The number of morphemes not found in the dictionaries
+        seconds: Total elapsed time in seconds of each stage
+        calls: The number of times each stage is performed
+    """
+
+    sentences: int
+    bytes: int
+    nodes: int
+    unknown_nodes: int
+    seconds: dict[str, float]
+    calls: dict[str, int]
+
+    def to_prometheus(self, prefix: str = "mecab") -> str:
+        """Returns the statistics in the Prometheus text exposition format.
+
+        Parameters:
+            prefix: A prefix of the metric names
+
+        Returns:
+            Counters of the statistics, with time and calls labeled by stage
+        """
+        lines = []
+        for name in ["sentences", "bytes", "nodes", "unknown_nodes"]:
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {getattr(self, name)}")
+
+        for name, values in [("stage_seconds", self.seconds), ("stage_calls", self.calls)]:
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for stage, value in values.items():
+                lines.append(f'{prefix}_{name}_total{{stage="{stage}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+
+class Instrumentation:
+    """Collects statistics of the analysis, which can be shared across threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, sentences: int, bytes: int, nodes: int, unknown_nodes: int, seconds: dict[str, float]):
+        with self._lock:
+            self._sentences += sentences
+            self._bytes += bytes
+            self._nodes += nodes
+            self._unknown_nodes += unknown_nodes
+            for stage, value in seconds.items():
+                self._seconds[stage] = self._seconds.get(stage, 0.0) + value
+                self._calls[stage] = self._calls.get(stage, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._sentences = 0
+            self._bytes = 0
+            self._nodes = 0
+            self._unknown_nodes = 0
+            self._seconds: dict[str, float] = {}
+            self._calls: dict[str, int] = {}
+
+    def snapshot(self) -> Stats:
+        with self._lock:
+            return Stats(
+                sentences=self._sentences,
+                bytes=self._bytes,
+                nodes=self._nodes,
+                unknown_nodes=self._unknown_nodes,
+                seconds=dict(self._seconds),
+                calls=dict(self._calls),
+            )
@@ -1,19 +1,65 @@
 from __future__ import annotations
 
+import functools
+import io
+import os
+import threading
+import time
+import weakref
+from operator import methodcaller
 from pathlib import Path
-from typing import Optional, Union
-
-import mecab_ko_dic
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional, TextIO, TypeVar, Union
 
 import _mecab
-from mecab.types import Dictionary, Morpheme
-from mecab.utils import create_lattice, ensure_list, to_csv
+from mecab.cache import ResultCache, feature_cache
+from mecab.instrumentation import Instrumentation, Stats
+from mecab.model import model_cache
+from mecab.types import Candidate, Columns, Constraint, Dictionary, LatticeGraph, Morpheme
+from mecab.utils import LatticePool, batch_lines, ensure_list, map_chunks, read_chunks, to_csv
 
 PathLike = Union[str, Path]
+T = TypeVar("T")
 
 mecabrc_path = Path(__file__).absolute().parent / "mecabrc"
 _rcfile_option = ["--rcfile", str(mecabrc_path)]
 
+# Outputs of the single-sentence APIs, which are also parts of the keys of cached results
+_morphemes = methodcaller("morphemes")
+_pos = methodcaller("pos")
+_surfaces = methodcaller("surfaces")
+_nouns = methodcaller("surfaces", include_pos=["N"])
+_confidences = methodcaller("confidences")
+_graph = methodcaller("graph")
+
+Tags = Union[str, Iterable[str]]
+
+
+@functools.lru_cache(maxsize=256)
+def _filtered(name: str, include_pos: tuple[str, ...], exclude_pos: tuple[str, ...]) -> methodcaller:
+    # The same output for the same filter, so that its results can be cached
+    return methodcaller(name, include_pos=list(include_pos), exclude_pos=list(exclude_pos))
+
+
+def _to_tags(tags: Optional[Tags]) -> tuple[str, ...]:
+    if tags is None:
+        return ()
+    return (tags,) if isinstance(tags, str) else tuple(tags)
+
+
+def _output(default: methodcaller, name: str, include_pos: Optional[Tags], exclude_pos: Optional[Tags]) -> methodcaller:
+    if (include_pos is None) and (exclude_pos is None):
+        return default
+    return _filtered(name, _to_tags(include_pos), _to_tags(exclude_pos))
+
+
+def _filter_kwargs(include_pos: Optional[Tags], exclude_pos: Optional[Tags]) -> dict[str, list[str]]:
+    kwargs = {}
+    if include_pos is not None:
+        kwargs["include_pos"] = list(_to_tags(include_pos))
+    if exclude_pos is not None:
+        kwargs["exclude_pos"] = list(_to_tags(exclude_pos))
+    return kwargs
+
 
 class MeCabError(Exception):
     """Raised if an error occurred from MeCab"""
@@ -26,63 +72,114 @@ class MeCab:  # APIs are inspired by KoNLPy
         self,
         dictionary_path: Optional[PathLike] = None,
         user_dictionary_path: Optional[Union[PathLike, list[PathLike]]] = None,
+        lattice_pool_size: int = 16,
+        instrument: bool = False,
+        cache: Optional[ResultCache] = None,
+        lazy: bool = False,
     ):
         """
         Parameters:
             dictionary_path: Path to the system dictionary to use. If not provided, the default mecab-ko-dic dictionary will be used.
             user_dictionary_path: Path or list of paths to user dictionaries to use. If not provided, no user dictionaries will be used.
+            lattice_pool_size: The maximum number of lattices to keep for reuse across parses.
+            instrument: Whether to collect statistics of the analysis, which can be retrieved by `stats()`.
+            cache: A cache to memoize the results of `parse()`, `pos()`, `morphs()` and `nouns()`.
+                It can be shared by multiple instances. If not provided, results will not be cached.
+            lazy: Whether to defer loading the dictionaries until they are used first.
+                `warmup()` can load them in the background beforehand.
         """
         if dictionary_path is None:
+            import mecab_ko_dic
+
             dictionary_path = mecab_ko_dic.dictionary_path
 
-        user_dictionary_path = ensure_list(user_dictionary_path)
+        self._dictionary_option = ["--dicdir", str(dictionary_path)]
+        self._reload_lock = threading.Lock()
+        self._options = self._to_options(user_dictionary_path)
 
-        dictionary_option = ["--dicdir", str(dictionary_path)]
-        user_dictionay_option = ["--userdic", to_csv(user_dictionary_path)] if user_dictionary_path else []
+        self._lattice_pool = LatticePool(max_size=lattice_pool_size)
+        self._instrumentation = Instrumentation() if instrument else None
+        self._cache = cache
 
-        options = [
-            *_rcfile_option,
-            *dictionary_option,
-            *user_dictionay_option,
-        ]
-        self._tagger = _mecab.Tagger(options)
+        if not lazy:
+            self._load()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called if the attribute is not set yet, so a lazy instance loads the dictionaries on first use
+        if name in ("_model", "_tagger", "_dictionary_identity"):
+            self._load()
+            return self.__dict__[name]
 
-    def parse(self, sentence: str) -> list[Morpheme]:
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def parse(
+        self,
+        sentence: str,
+        with_confidence: bool = False,
+        theta: Optional[float] = None,
+        constraints: Optional[list[Constraint]] = None,
+        include_pos: Optional[Tags] = None,
+        exclude_pos: Optional[Tags] = None,
+    ) -> Union[list[Morpheme], list[tuple[Morpheme, float]]]:
         """Perform morpheme analysis on a given sentence.
 
+        Morphemes not selected by `include_pos` and `exclude_pos` are skipped while the result is built,
+        so they cost nothing to convert.
+
         Parameters:
             sentence: A sentence to analyze
+            with_confidence: Whether to return the marginal probability of each morpheme together
+            theta: Temperature of marginal probabilities. If not provided, the value of the dictionary will be used.
+            constraints: A list of `Constraint` objects or `(start, end, feature)` tuples.
+                Each span is analyzed as a single morpheme matching the feature.
+            include_pos: Prefixes of part-of-speech tags to include, e.g. `["N", "V"]`. If not provided, every morpheme is included.
+            exclude_pos: Prefixes of part-of-speech tags to exclude, e.g. `["J", "E", "S"]`
 
         Returns:
             A list of `Morpheme` objects representing each morpheme in the given sentence.
+            If `with_confidence` is `True`, a list of `(Morpheme, marginal probability)` pairs instead.
         """
-        lattice = create_lattice(sentence)
-        if not self._tagger.parse(lattice):
-            raise MeCabError(self._tagger.what())
+        native_constraints = Constraint._to_native(constraints) if constraints else None
+        if with_confidence:
+            theta = theta if theta is not None else self._tagger.theta()
+            output = _output(_confidences, "confidences", include_pos, exclude_pos)
+            return self._analyze(sentence, output, _mecab.MECAB_MARGINAL_PROB, theta, native_constraints)
 
-        return [Morpheme._from_node(span, node) for span, node in lattice]
+        output = _output(_morphemes, "morphemes", include_pos, exclude_pos)
+        if native_constraints:
+            return self._analyze(sentence, output, constraints=native_constraints)
 
-    def pos(self, sentence: str) -> list[tuple[str, str]]:
+        return self._parse(sentence, output)
+
+    def pos(
+        self, sentence: str, include_pos: Optional[Tags] = None, exclude_pos: Optional[Tags] = None
+    ) -> list[tuple[str, str]]:
         """Extract `(surface, part-of-speech tag)` pairs from a given sentence.
 
         Parameters:
             sentence: A sentence to analyze
+            include_pos: Prefixes of part-of-speech tags to include, e.g. `["N", "V"]`. If not provided, every morpheme is included.
+            exclude_pos: Prefixes of part-of-speech tags to exclude, e.g. `["J", "E", "S"]`
 
         Returns:
             A list of `(surface, part-of-speech tag)` pairs representing each morpheme in the given sentence.
         """
-        return [(morpheme.surface, morpheme.pos) for morpheme in self.parse(sentence)]
+        return self._parse(sentence, _output(_pos, "pos", include_pos, exclude_pos))
 
-    def morphs(self, sentence: str) -> list[str]:
+    def morphs(
+        self, sentence: str, include_pos: Optional[Tags] = None, exclude_pos: Optional[Tags] = None
+    ) -> list[str]:
         """Extract morphemes from a given sentence.
 
         Parameters:
             sentence: A sentence to analyze
+            include_pos: Prefixes of part-of-speech tags to include, e.g. `["N", "V"]`. If not provided, every morpheme is included.
+            exclude_pos: Prefixes of part-of-speech tags to exclude, e.g. `["J", "E", "S"]`
 
         Returns:
             A list of morphemes in the given sentence.
         """
-        return [morpheme.surface for morpheme in self.parse(sentence)]
+        return self._parse(sentence, _output(_surfaces, "surfaces", include_pos, exclude_pos))
 
     def nouns(self, sentence: str) -> list[str]:
         """Extract nouns from a given sentence
@@ -93,7 +190,229 @@ class MeCab:  # APIs are inspired by KoNLPy
         Returns:
             A list of nouns in the given sentence
         """
-        return [morpheme.surface for morpheme in self.parse(sentence) if morpheme.pos.startswith("N")]
+        return self._parse(sentence, _nouns)
+
+    def parse_nbest(self, sentence: str, n: int) -> list[Candidate]:
+        """Perform morpheme analysis on a given sentence, and return the `n` best candidates.
+
+        Parameters:
+            sentence: A sentence to analyze
+            n: The maximum number of candidates
+
+        Returns:
+            A list of `Candidate` objects in ascending order of cost. The first one is the same as the result of `parse()`.
+        """
+        if n < 1:
+            raise ValueError("n must be a positive integer")
+
+        candidates = self._analyze(sentence, methodcaller("nbest", n), _mecab.MECAB_NBEST)
+        return [Candidate(morphemes, cost) for morphemes, cost in candidates]
+
+    def lattice_graph(self, sentence: str, theta: Optional[float] = None) -> LatticeGraph:
+        """Perform morpheme analysis on a given sentence, and return every candidate morpheme and path between them.
+
+        Parameters:
+            sentence: A sentence to analyze
+            theta: Temperature of marginal probabilities. If not provided, the value of the dictionary will be used.
+
+        Returns:
+            A `LatticeGraph` object containing the nodes and paths of the lattice as contiguous arrays.
+        """
+        theta = theta if theta is not None else self._tagger.theta()
+        # MeCab keeps the paths between nodes only if marginal probabilities or n-best paths are requested
+        request_type = _mecab.MECAB_ALL_MORPHS | _mecab.MECAB_MARGINAL_PROB
+        return LatticeGraph._from_graph(self._analyze(sentence, _graph, request_type, theta))
+
+    def parse_batch(
+        self,
+        sentences: list[str],
+        number_of_threads: int = 1,
+        with_confidence: bool = False,
+        theta: Optional[float] = None,
+        constraints: Optional[list[list[Constraint]]] = None,
+        include_pos: Optional[Tags] = None,
+        exclude_pos: Optional[Tags] = None,
+    ) -> Union[list[list[Morpheme]], list[list[tuple[Morpheme, float]]]]:
+        """Perform morpheme analysis on given sentences at once.
+
+        The analysis runs without holding the GIL, and can be distributed across multiple native threads.
+
+        Parameters:
+            sentences: A list of sentences to analyze
+            number_of_threads: The number of threads to analyze the sentences with
+            with_confidence: Whether to return the marginal probability of each morpheme together
+            theta: Temperature of marginal probabilities. If not provided, the value of the dictionary will be used.
+            constraints: A list of constraints for each of the given sentences, as in `parse()`
+            include_pos: Prefixes of part-of-speech tags to include, as in `parse()`
+            exclude_pos: Prefixes of part-of-speech tags to exclude, as in `parse()`
+
+        Returns:
+            A list of `Morpheme` lists, one for each of the given sentences.
+            If `with_confidence` is `True`, lists of `(Morpheme, marginal probability)` pairs instead.
+        """
+        kwargs = _filter_kwargs(include_pos, exclude_pos)
+        if with_confidence:
+            kwargs["theta"] = theta if theta is not None else self._tagger.theta()
+        if constraints is not None:
+            kwargs["constraints"] = [Constraint._to_native(constraints_) for constraints_ in constraints]
+
+        return self._parse_batch(self._tagger.parse_batch, sentences, number_of_threads, **kwargs)
+
+    def pos_batch(
+        self,
+        sentences: list[str],
+        number_of_threads: int = 1,
+        include_pos: Optional[Tags] = None,
+        exclude_pos: Optional[Tags] = None,
+    ) -> list[list[tuple[str, str]]]:
+        """Extract `(surface, part-of-speech tag)` pairs from given sentences at once.
+
+        Parameters:
+            sentences: A list of sentences to analyze
+            number_of_threads: The number of threads to analyze the sentences with
+            include_pos: Prefixes of part-of-speech tags to include, as in `parse()`
+            exclude_pos: Prefixes of part-of-speech tags to exclude, as in `parse()`
+
+        Returns:
+            A list of `(surface, part-of-speech tag)` pair lists, one for each of the given sentences.
+        """
+        kwargs = _filter_kwargs(include_pos, exclude_pos)
+        return self._parse_batch(self._tagger.pos_batch, sentences, number_of_threads, **kwargs)
+
+    def morphs_batch(
+        self,
+        sentences: list[str],
+        number_of_threads: int = 1,
+        include_pos: Optional[Tags] = None,
+        exclude_pos: Optional[Tags] = None,
+    ) -> list[list[str]]:
+        """Extract morphemes from given sentences at once.
+
+        Parameters:
+            sentences: A list of sentences to analyze
+            number_of_threads: The number of threads to analyze the sentences with
+            include_pos: Prefixes of part-of-speech tags to include, as in `parse()`
+            exclude_pos: Prefixes of part-of-speech tags to exclude, as in `parse()`
+
+        Returns:
+            A list of morpheme lists, one for each of the given sentences.
+        """
+        kwargs = _filter_kwargs(include_pos, exclude_pos)
+        return self._parse_batch(self._tagger.surfaces_batch, sentences, number_of_threads, **kwargs)
+
+    def nouns_batch(self, sentences: list[str], number_of_threads: int = 1) -> list[list[str]]:
+        """Extract nouns from given sentences at once.
+
+        Parameters:
+            sentences: A list of sentences to analyze
+            number_of_threads: The number of threads to analyze the sentences with
+
+        Returns:
+            A list of noun lists, one for each of the given sentences.
+        """
+        return self._parse_batch(self._tagger.surfaces_batch, sentences, number_of_threads, include_pos=["N"])
+
+    def parse_columnar(
+        self,
+        sentences: list[str],
+        number_of_threads: int = 1,
+        include_pos: Optional[Tags] = None,
+        exclude_pos: Optional[Tags] = None,
+    ) -> Columns:
+        """Perform morpheme analysis on given sentences at once, and return the result as contiguous arrays.
+
+        Parameters:
+            sentences: A list of sentences to analyze
+            number_of_threads: The number of threads to analyze the sentences with
+            include_pos: Prefixes of part-of-speech tags to include, as in `parse()`
+            exclude_pos: Prefixes of part-of-speech tags to exclude, as in `parse()`
+
+        Returns:
+            A `Columns` object containing the morphemes of all the given sentences.
+        """
+        kwargs = _filter_kwargs(include_pos, exclude_pos)
+        columns = self._parse_batch(self._tagger.parse_columnar, sentences, number_of_threads, **kwargs)
+        return Columns._from_columns(columns)
+
+    def parse_document(self, document: str, number_of_threads: int = 1, max_length: int = 1000) -> list[Morpheme]:
+        """Perform morpheme analysis on a long document, in pieces of bounded length.
+
+        The document is split into sentences natively. Sentences longer than `max_length` are split further
+        into overlapping windows, cut at whitespace where possible, and stitched back where both windows agree.
+        Each piece is analyzed separately, so memory usage does not depend on the length of the document.
+
+        Parameters:
+            document: A document to analyze
+            number_of_threads: The number of threads to analyze the pieces with
+            max_length: The maximum number of characters in a piece
+
+        Returns:
+            A list of `Morpheme` objects representing each morpheme in the given document,
+            whose spans are indexes in the document.
+        """
+        if max_length < 1:
+            raise ValueError("max_length must be a positive integer")
+
+        return self._parse_batch(self._tagger.parse_document, document, number_of_threads, max_length=max_length)
+
+    def iter_parse(
+        self,
+        source: Union[PathLike, BinaryIO, TextIO, Iterable[str]],
+        chunk_size: int = 1024 * 1024,
+        number_of_threads: int = 1,
+        memory_map: bool = False,
+        file_offsets: bool = False,
+    ) -> Iterator[list[Morpheme]]:
+        """Perform morpheme analysis on each line of a given source lazily.
+
+        The source is read in chunks of about `chunk_size`, so that memory usage does not depend on the size of the source.
+
+        Parameters:
+            source: A path to a UTF-8 text file, a file object, or an iterable of sentences
+            chunk_size: The size of a chunk to read at once, in bytes for binary sources and characters otherwise
+            number_of_threads: The number of threads to analyze each chunk with
+            memory_map: Whether to map the file of `source` into memory instead of reading it. `source` must be a path.
+            file_offsets: Whether spans are byte offsets in the file instead of character offsets in each line.
+                `source` must be a path or a binary file.
+
+        Returns:
+            An iterator of `Morpheme` lists, one for each line in the given source.
+        """
+        is_path = isinstance(source, (str, os.PathLike))
+        is_binary = (not is_path) and hasattr(source, "read") and (not isinstance(source, io.TextIOBase))
+        if memory_map and not is_path:
+            raise ValueError("memory_map requires a path")
+        if file_offsets and not (is_path or is_binary):
+            raise ValueError("file_offsets requires a path or a binary file")
+
+        if is_path and memory_map:
+            yield from self._parse_chunks(map_chunks(source, chunk_size), number_of_threads, file_offsets)
+        elif is_path:
+            with open(source, "rb") as file:
+                yield from self._parse_chunks(read_chunks(file, chunk_size), number_of_threads, file_offsets)
+        elif is_binary:
+            yield from self._parse_chunks(read_chunks(source, chunk_size), number_of_threads, file_offsets)
+        else:
+            for lines in batch_lines(source, chunk_size):
+                yield from self.parse_batch(lines, number_of_threads)
+
+    def stats(self) -> Stats:
+        """Returns statistics collected since this instance is created or `reset_stats()` is called.
+
+        Returns:
+            A `Stats` object representing a snapshot of the statistics.
+        """
+        if self._instrumentation is None:
+            raise RuntimeError("instrumentation is not enabled; create MeCab with instrument=True")
+
+        return self._instrumentation.snapshot()
+
+    def reset_stats(self):
+        """Resets the collected statistics."""
+        if self._instrumentation is None:
+            raise RuntimeError("instrumentation is not enabled; create MeCab with instrument=True")
+
+        self._instrumentation.reset()
 
     @property
     def dictionary(self) -> list[Dictionary]:
@@ -103,3 +422,186 @@ class MeCab:  # APIs are inspired by KoNLPy
             A list of `Dictionary` objects representing the dictionaries currently loaded.
         """
         return Dictionary._from_dictionary_info(self._tagger.dictionary_info())
+
+    def reload_user_dictionaries(self, user_dictionary_path: Optional[Union[PathLike, list[PathLike]]]):
+        """Replace the user dictionaries of this instance without interrupting ongoing analyses.
+
+        New dictionaries are loaded while this instance keeps analyzing with the current ones, and then swapped in
+        at once. Analyses in progress finish with the previous dictionaries, which are freed when they are done.
+        Dictionaries rebuilt at the same paths are loaded again. Other instances using the same dictionaries are
+        not affected.
+
+        Parameters:
+            user_dictionary_path: Path or list of paths to user dictionaries to use. If not provided, no user dictionaries will be used.
+        """
+        with self._reload_lock:
+            options = self._to_options(user_dictionary_path)
+            if not self._is_loaded():
+                self._options = options
+                return
+
+            model = model_cache.acquire(options)
+            try:
+                tagger = model.create_tagger()
+            except BaseException:
+                model_cache.release(model, evict=True)
+                raise
+
+            previous_model = self._model
+            self._finalizer.detach()
+            self._options, self._model, self._tagger = options, model, tagger
+            self._finalizer = weakref.finalize(self, model_cache.release, model)
+            if self._cache is not None:
+                self._dictionary_identity = self._identify_dictionary()
+
+            model_cache.release(previous_model, evict=True)
+            if model_cache.identity(previous_model) is None:
+                # Features of the previous dictionaries are not used anymore
+                feature_cache.clear()
+
+    def warmup(self) -> threading.Thread:
+        """Load the dictionaries and read them into memory in a background thread.
+
+        It avoids the latency of loading the dictionaries and faulting their pages in on the first analyses.
+        Analyses requested in the meantime wait until the dictionaries are loaded.
+
+        Returns:
+            The background thread, which can be joined to wait until the warmup is done.
+        """
+        thread = threading.Thread(target=self._warmup, name="mecab-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def _warmup(self):
+        self._load()
+
+        paths = [dictionary.path for dictionary in self.dictionary]
+        system_path = paths[0].parent
+        paths += [system_path / "matrix.bin", system_path / "char.bin", system_path / "unk.dic"]
+
+        # Dictionaries are memory-mapped, so reading them brings their pages into the page cache
+        for path in paths:
+            try:
+                with open(path, "rb", buffering=0) as input_file:
+                    while input_file.read(1024 * 1024):
+                        pass
+            except OSError:
+                pass
+
+    def _is_loaded(self) -> bool:
+        return "_dictionary_identity" in self.__dict__
+
+    def _load(self):
+        with self._reload_lock:
+            if self._is_loaded():
+                return
+
+            self._model = model_cache.acquire(self._options)
+            self._tagger = self._model.create_tagger()
+            self._finalizer = weakref.finalize(self, model_cache.release, self._model)
+            # Set at last, as it marks the instance loaded
+            self._dictionary_identity = self._identify_dictionary() if self._cache is not None else None
+
+    def _to_options(self, user_dictionary_path: Optional[Union[PathLike, list[PathLike]]]) -> list[str]:
+        user_dictionary_path = ensure_list(user_dictionary_path)
+        user_dictionay_option = ["--userdic", to_csv(user_dictionary_path)] if user_dictionary_path else []
+
+        return [
+            *_rcfile_option,
+            *self._dictionary_option,
+            *user_dictionay_option,
+        ]
+
+    def _identify_dictionary(self) -> tuple:
+        # Identities of the dictionary files when the model was loaded, not of the files at present
+        return model_cache.identity(self._model)
+
+    def _parse(self, sentence: str, output: Callable[[_mecab.Lattice], list[T]]) -> list[T]:
+        if self._cache is None:
+            return self._analyze(sentence, output)
+
+        key = (self._dictionary_identity, output, sentence)
+        result = self._cache.get(key)
+        if result is not None:
+            return list(result)
+
+        result = self._analyze(sentence, output)
+        self._cache.put(key, tuple(result))
+        return result
+
+    def _analyze(
+        self,
+        sentence: str,
+        output: Callable[[_mecab.Lattice], T],
+        request_type: int = _mecab.MECAB_ONE_BEST,
+        theta: Optional[float] = None,
+        constraints: Optional[list[tuple[int, int, str]]] = None,
+    ) -> T:
+        if self._instrumentation is not None:
+            return self._parse_instrumented(sentence, output, request_type, theta, constraints)
+
+        tagger = self._tagger  # Keeps the model alive until the result is converted, even if it is reloaded
+        lattice = self._lattice_pool.acquire(sentence, request_type, theta, constraints)
+        try:
+            if not tagger.parse(lattice):
+                raise MeCabError(lattice.what())
+
+            return output(lattice)
+        finally:
+            self._lattice_pool.release(lattice, sentence)
+
+    def _parse_instrumented(
+        self,
+        sentence: str,
+        output: Callable[[_mecab.Lattice], T],
+        request_type: int,
+        theta: Optional[float],
+        constraints: Optional[list[tuple[int, int, str]]],
+    ) -> T:
+        tagger = self._tagger
+        start = time.perf_counter()
+        lattice = self._lattice_pool.acquire(sentence, request_type, theta, constraints)
+        try:
+            analysis_start = time.perf_counter()
+            if not tagger.parse(lattice):
+                raise MeCabError(lattice.what())
+
+            conversion_start = time.perf_counter()
+            result = output(lattice)
+            end = time.perf_counter()
+
+            nodes, unknown_nodes = lattice.count_nodes()
+            seconds = {
+                "lattice": analysis_start - start,
+                "analysis": conversion_start - analysis_start,
+                "conversion": end - conversion_start,
+            }
+            self._instrumentation.record(1, lattice.size(), nodes, unknown_nodes, seconds)
+            return result
+        finally:
+            self._lattice_pool.release(lattice, sentence)
+
+    def _parse_chunks(
+        self, chunks: Iterator[tuple[int, memoryview]], number_of_threads: int, file_offsets: bool
+    ) -> Iterator[list[Morpheme]]:
+        for offset, chunk in chunks:
+            yield from self._parse_batch(
+                self._tagger.parse_lines, chunk, number_of_threads, offset=(offset if file_offsets else None)
+            )
+
+    def _parse_batch(self, parse: Callable[..., list[Any]], sentences: Any, number_of_threads: int, **kwargs):
+        if self._instrumentation is not None:
+            counters = kwargs["counters"] = _mecab.Counters()
+            start = time.perf_counter()
+
+        try:
+            result = parse(sentences, number_of_threads, **kwargs)
+        except RuntimeError as error:
+            raise MeCabError(str(error)) from error
+
+        if self._instrumentation is not None:
+            seconds = {"batch": time.perf_counter() - start}
+            self._instrumentation.record(
+                counters.sentences, counters.bytes, counters.nodes, counters.unknown_nodes, seconds
+            )
+        return result
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import contextlib
+import csv
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+import _mecab
+
+# Files of a system dictionary which are loaded into a model
+_dictionary_files = ["sys.dic", "matrix.bin", "matrix.def", "char.bin", "unk.dic"]
+
+Key = tuple  # (options, identity of the dictionary files)
+
+
+class _Entry(NamedTuple):
+    model: _mecab.Model
+    references: int
+
+
+def _stat(path: Path) -> Optional[tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _identify(options: tuple[str, ...]) -> tuple:
+    # Dictionaries rebuilt at the same paths are distinguished by the identities of their files
+    paths = []
+    for option, value in zip(options, options[1:]):
+        if option == "--dicdir":
+            paths += [Path(value) / name for name in _dictionary_files]
+        elif option == "--userdic":
+            paths += [Path(path) for path in next(csv.reader([value]))]
+    return tuple((str(path), _stat(path)) for path in paths)
+
+
+class ModelCache:
+    """A process-wide cache of loaded models, shared by `MeCab` instances.
+
+    A model holds the system dictionary and user dictionaries. Instances created with the same dictionaries
+    share a single model, so that creating a `MeCab` instance does not load the dictionaries again.
+    Models are keyed by the identities (inode, modification time and size) of the dictionary files as well,
+    so dictionaries rebuilt at the same paths are loaded again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._owner: Optional[int] = None  # Thread holding the lock
+        self._pending: deque[tuple[_mecab.Model, bool]] = deque()
+        self._entries: dict[Key, _Entry] = {}
+        self._keys: dict[int, Key] = {}  # id() of each model to its key
+
+    def acquire(self, options: list[str]) -> _mecab.Model:
+        """Returns the model for given options, loading it if it is not cached yet or the dictionaries are changed.
+
+        Parameters:
+            options: Options to load the model with
+
+        Returns:
+            A shared `_mecab.Model` object. It must be returned with `release()` when it is no longer used.
+        """
+        key = (tuple(options), _identify(tuple(options)))
+        with self._locked():
+            if key in self._entries:
+                return self._reference(key)
+
+        # Loaded without the lock, so that other instances are not blocked while the dictionaries are loaded
+        model = _mecab.Model(options)
+        with self._locked():
+            if key not in self._entries:
+                # Unused models of previous versions of the dictionaries would never be acquired again
+                for stale_key in [k for k, e in self._entries.items() if k[0] == key[0] and e.references == 0]:
+                    self._remove(stale_key)
+
+                # Otherwise, the model loaded by another thread in the meantime is shared
+                self._entries[key] = _Entry(model=model, references=0)
+                self._keys[id(model)] = key
+
+            return self._reference(key)
+
+    def release(self, model: _mecab.Model, evict: bool = False):
+        """Returns a model acquired by `acquire()`. The model is kept cached until it is evicted,
+        unless the dictionaries are changed since it was loaded.
+
+        Parameters:
+            model: The model to return
+            evict: Whether to evict the model at once if it is no longer used by any instance
+        """
+        if self._owner == threading.get_ident():
+            # Called by a finalizer which the garbage collector runs while this thread holds the lock
+            self._pending.append((model, evict))
+            return
+
+        with self._locked():
+            self._release(model, evict)
+
+    def evict(self) -> int:
+        """Evicts models that are not used by any instance.
+
+        Returns:
+            The number of evicted models.
+        """
+        with self._locked():
+            unused = [key for key, entry in self._entries.items() if entry.references == 0]
+            for key in unused:
+                self._remove(key)
+
+            return len(unused)
+
+    def references(self, options: list[str]) -> int:
+        """Returns the number of instances using the model for given options and the current dictionaries."""
+        with self._locked():
+            entry = self._entries.get((tuple(options), _identify(tuple(options))))
+            return entry.references if entry is not None else 0
+
+    def identity(self, model: _mecab.Model) -> Optional[Key]:
+        """Returns the options and the identities of the dictionary files which a cached model is loaded with."""
+        with self._locked():
+            return self._keys.get(id(model))
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            self._owner = threading.get_ident()
+            try:
+                yield
+            finally:
+                # Releases deferred while the lock was held, including the ones deferred in this loop
+                while self._pending:
+                    self._release(*self._pending.popleft())
+                self._owner = None
+
+    def _reference(self, key: Key) -> _mecab.Model:
+        entry = self._entries[key]
+        self._entries[key] = entry._replace(references=entry.references + 1)
+        return entry.model
+
+    def _release(self, model: _mecab.Model, evict: bool):
+        key = self._keys.get(id(model))
+        if key is None:
+            return
+
+        entry = self._entries[key]
+        references = max(entry.references - 1, 0)
+        if (references == 0) and (evict or (key[1] != _identify(key[0]))):
+            self._remove(key)
+        else:
+            self._entries[key] = entry._replace(references=references)
+
+    def _remove(self, key: Key):
+        entry = self._entries.pop(key)
+        del self._keys[id(entry.model)]
+
+    def __len__(self) -> int:
+        with self._locked():
+            return len(self._entries)
+
+
+model_cache = ModelCache()
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from itertools import islice
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from mecab.mecab import MeCab, PathLike
+from mecab.types import Columns
+
+Corpus = Union[PathLike, List[PathLike], Iterable[str]]
+
+
+class Throughput(NamedTuple):
+    """Represents the progress of tokenizing a corpus
+
+    Attributes:
+        sentences: The number of tokenized sentences
+        bytes: The number of bytes of the tokenized sentences in UTF-8
+        seconds: Elapsed time in seconds
+    """
+
+    sentences: int
+    bytes: int
+    seconds: float
+
+    @property
+    def sentences_per_second(self) -> float:
+        return self.sentences / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes / (1024 * 1024) / self.seconds if self.seconds > 0 else 0.0
+
+
+class _Chunk(NamedTuple):
+    name: str  # Name of the shared memory holding the arrays
+    layout: list[tuple[int, int, str]]  # (offset, size, format) of each array
+    pos_tags: list[str]
+    number_of_sentences: int
+    number_of_bytes: int
+
+
+# A MeCab instance of the current process, and the arguments it is created with
+_mecab: Optional[MeCab] = None
+_mecab_arguments: Optional[tuple] = None
+
+
+def _initialize(dictionary_path: Optional[PathLike], user_dictionary_path: Optional[Union[PathLike, list[PathLike]]]):
+    global _mecab, _mecab_arguments
+
+    arguments = (dictionary_path, user_dictionary_path)
+    if arguments != _mecab_arguments:  # Otherwise, it is already loaded before fork
+        _mecab = MeCab(dictionary_path=dictionary_path, user_dictionary_path=user_dictionary_path)
+        _mecab_arguments = arguments
+
+
+def _tokenize(sentences: list[str]) -> _Chunk:
+    columns = _mecab.parse_columnar(sentences)
+    arrays = [columns.sentence_offsets, columns.starts, columns.ends, columns.pos_ids, columns.surface_offsets]
+    arrays.append(columns.surfaces)
+
+    size = sum(array.nbytes for array in arrays)
+    memory = SharedMemory(create=True, size=max(size, 1))
+    if multiprocessing.parent_process() is not None:
+        # The receiving process unlinks the shared memory, so that the worker must not track it
+        resource_tracker.unregister(memory._name, "shared_memory")
+    try:
+        layout = []
+        offset = 0
+        for array in arrays:
+            memory.buf[offset : offset + array.nbytes] = array.cast("B")
+            layout.append((offset, array.nbytes, array.format))
+            offset += array.nbytes
+    finally:
+        memory.close()
+
+    return _Chunk(
+        name=memory.name,
+        layout=layout,
+        pos_tags=columns.pos_tags,
+        number_of_sentences=len(sentences),
+        number_of_bytes=sum(len(sentence.encode("utf-8")) for sentence in sentences),
+    )
+
+
+def _receive(chunk: _Chunk) -> Columns:
+    memory = SharedMemory(name=chunk.name)
+    try:
+        arrays = [memoryview(bytes(memory.buf[offset : offset + size])).cast(fmt) for offset, size, fmt in chunk.layout]
+    finally:
+        memory.close()
+        memory.unlink()
+
+    sentence_offsets, starts, ends, pos_ids, surface_offsets, surfaces = arrays
+    return Columns(sentence_offsets, starts, ends, pos_ids, chunk.pos_tags, surface_offsets, surfaces)
+
+
+def _read_sentences(corpus: Corpus) -> Iterator[str]:
+    if isinstance(corpus, (str, os.PathLike)):
+        corpus = [Path(corpus)]
+
+    for item in corpus:
+        if isinstance(item, os.PathLike):
+            with open(item, encoding="utf-8") as input_file:
+                for line in input_file:
+                    yield line.rstrip("\r\n")
+        else:
+            yield item
+
+
+def _chunk(sentences: Iterator[str], chunk_size: int) -> Iterator[list[str]]:
+    while True:
+        chunk = list(islice(sentences, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def tokenize_corpus(
+    corpus: Corpus,
+    workers: Optional[int] = None,
+    chunk_size: int = 1024,
+    dictionary_path: Optional[PathLike] = None,
+    user_dictionary_path: Optional[Union[PathLike, list[PathLike]]] = None,
+    on_progress: Optional[Callable[[Throughput], None]] = None,
+) -> Iterator[Columns]:
+    """Tokenize a corpus with multiple processes.
+
+    The corpus is split into chunks of sentences, and each chunk is tokenized by a worker process.
+    Dictionaries are loaded once before the workers are forked, so that the workers share them.
+    Tokenized chunks are sent back through shared memory as `Columns`, in the order of the corpus.
+
+    Parameters:
+        corpus: A path or list of paths to UTF-8 text files with a sentence per line, or an iterable of sentences.
+            Note that a `str` is treated as a path, and an iterable of `str` is treated as sentences.
+        workers: The number of worker processes. If not provided, the number of CPUs will be used.
+        chunk_size: The number of sentences in a chunk
+        dictionary_path: Path to the system dictionary to use. If not provided, the default mecab-ko-dic dictionary will be used.
+        user_dictionary_path: Path or list of paths to user dictionaries to use. If not provided, no user dictionaries will be used.
+        on_progress: A function called with the `Throughput` so far after each chunk
+
+    Returns:
+        An iterator of `Columns`, one for each chunk of sentences.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    chunks = _chunk(_read_sentences(corpus), chunk_size)
+    start = time.perf_counter()
+    number_of_sentences = 0
+    number_of_bytes = 0
+
+    def report(chunk: _Chunk):
+        nonlocal number_of_sentences, number_of_bytes
+        number_of_sentences += chunk.number_of_sentences
+        number_of_bytes += chunk.number_of_bytes
+        if on_progress is not None:
+            on_progress(Throughput(number_of_sentences, number_of_bytes, time.perf_counter() - start))
+
+    initialize_arguments = (dictionary_path, user_dictionary_path)
+    if workers <= 1:
+        _initialize(*initialize_arguments)
+        for sentences in chunks:
+            chunk = _tokenize(sentences)
+            report(chunk)
+            yield _receive(chunk)
+        return
+
+    context = multiprocessing.get_context("fork" if sys.platform.startswith("linux") else None)
+    if context.get_start_method() == "fork":
+        _initialize(*initialize_arguments)  # Fork after loading dictionaries, so that workers share them
+
+    with context.Pool(workers, initializer=_initialize, initargs=initialize_arguments) as pool:
+        # Keep a bounded number of chunks in flight, so that memory usage does not depend on the corpus size
+        in_flight = deque()
+        try:
+            for sentences in chunks:
+                in_flight.append(pool.apply_async(_tokenize, (sentences,)))
+                if len(in_flight) >= workers * 2:
+                    chunk = in_flight.popleft().get()
+                    report(chunk)
+                    yield _receive(chunk)
+
+            while in_flight:
+                chunk = in_flight.popleft().get()
+                report(chunk)
+                yield _receive(chunk)
+        finally:
+            # Release shared memory of the chunks which are not consumed
+            while in_flight:
+                _receive(in_flight.popleft().get())
@@ -2,18 +2,26 @@
 
 namespace py = pybind11;
 
+void initialize_buffer(py::module &m);
 void initialize_cli(py::module &m);
 void initialize_dictionaryinfo(py::module &m);
+void initialize_featurecache(py::module &m);
 void initialize_lattice(py::module &m);
+void initialize_model(py::module &m);
 void initialize_node(py::module &m);
 void initialize_path(py::module &m);
+void initialize_posregistry(py::module &m);
 void initialize_tagger(py::module &m);
 
 PYBIND11_MODULE(_mecab, m) {
+  initialize_buffer(m);
   initialize_cli(m);
   initialize_dictionaryinfo(m);
+  initialize_featurecache(m);
   initialize_lattice(m);
+  initialize_model(m);
   initialize_node(m);
   initialize_path(m);
+  initialize_posregistry(m);
   initialize_tagger(m);
 }
\ No newline at end of file
@@ -0,0 +1,110 @@
+#include "batch.h"
+
+#include <algorithm>
+#include <atomic>
+#include <cstring>
+#include <memory>
+#include <thread>
+
+#include "lattice.h"
+
+std::vector<Sentence> to_sentences(const std::vector<std::string> &sentences) {
+  std::vector<Sentence> views;
+  views.reserve(sentences.size());
+  for (const auto &sentence : sentences) {
+    views.push_back(Sentence{sentence.c_str(), sentence.size(), 0});
+  }
+  return views;
+}
+
+std::vector<Sentence> split_lines(const char *buffer, size_t size) {
+  std::vector<Sentence> lines;
+
+  const char *end = buffer + size;
+  for (const char *begin = buffer; begin < end;) {
+    const char *newline = static_cast<const char *>(std::memchr(begin, '\n', end - begin));
+    const char *line_end = (newline != nullptr) ? newline : end;
+
+    size_t length = line_end - begin;
+    if ((length > 0) && (begin[length - 1] == '\r')) {
+      length -= 1;
+    }
+    lines.push_back(Sentence{begin, length, static_cast<size_t>(begin - buffer)});
+
+    begin = line_end + 1;
+  }
+  return lines;
+}
+
+static void analyze(const MeCab::Tagger &tagger, MeCab::Lattice *lattice, const Sentence &sentence,
+                    const Filter &filter, Unit unit, const Request &request, Result &result) {
+  lattice->set_request_type(request.type);
+  lattice->set_sentence(sentence.text, sentence.length);
+  lattice->set_theta(request.theta); // Must be set after the sentence, which resets the lattice
+  if (sentence.constraints != nullptr) {
+    set_constraints(*lattice, *sentence.constraints);
+  }
+  if (!tagger.parse(lattice)) {
+    result.what = lattice->what();
+    return;
+  }
+
+  const char *begin = sentence.text;
+  Iterator iterator(lattice->bos_node()->next, lattice->sentence(), unit);
+  Iterator end(lattice->eos_node(), lattice->sentence(), unit);
+  for (; iterator != end; ++iterator) {
+    const auto &token = *iterator;
+    const MeCab::Node &node = std::get<1>(token);
+    result.number_of_nodes += 1;
+    if (node.stat == MECAB_UNK_NODE) {
+      result.number_of_unknown_nodes += 1;
+    }
+    if (!filter(node.feature)) {
+      continue;
+    }
+    const Span &span = std::get<0>(token);
+    result.tokens.push_back(Token{Span{std::get<0>(span) + sentence.offset, std::get<1>(span) + sentence.offset},
+                                  static_cast<size_t>(node.surface - begin), node.length, node.feature, node.prob,
+                                  (sentence.constraints == nullptr) || (node.stat != MECAB_UNK_NODE)});
+  }
+  result.succeeded = true;
+}
+
+std::vector<Result> analyze_batch(const MeCab::Tagger &tagger, const std::vector<Sentence> &sentences,
+                                  size_t number_of_threads, const Filter &filter, Unit unit,
+                                  const Request &request) {
+  std::vector<Result> results(sentences.size());
+  std::atomic<size_t> next{0};
+
+  // Each worker reuses a single lattice for all the sentences it takes
+  auto work = [&]() {
+    std::unique_ptr<MeCab::Lattice> lattice(MeCab::Lattice::create());
+    for (size_t index = next++; index < sentences.size(); index = next++) {
+      analyze(tagger, lattice.get(), sentences[index], filter, unit, request, results[index]);
+    }
+  };
+
+  number_of_threads = std::max<size_t>(1, std::min(number_of_threads, sentences.size()));
+  if (number_of_threads == 1) {
+    work();
+  } else {
+    std::vector<std::thread> workers;
+    for (size_t index = 0; index < number_of_threads; index += 1) {
+      workers.emplace_back(work);
+    }
+    for (auto &worker : workers) {
+      worker.join();
+    }
+  }
+
+  return results;
+}
+
+void count(const std::vector<Sentence> &sentences, const std::vector<Result> &results, Counters &counters) {
+  counters.sentences += sentences.size();
+  for (size_t index = 0; index < sentences.size(); index += 1) {
+    counters.bytes += sentences[index].length;
+    counters.nodes += results[index].number_of_nodes;
+    counters.unknown_nodes += results[index].number_of_unknown_nodes;
+  }
+}
@@ -0,0 +1,52 @@
+#pragma once
+
+#include <string>
+#include <vector>
+
+#include <mecab.h>
+
+#include "constraint.h"
+#include "morpheme.h"
+
+// A view of a sentence in a buffer owned by the caller
+struct Sentence {
+  const char *text;
+  size_t length;
+  size_t offset; // Added to the spans of morphemes
+  const std::vector<Constraint> *constraints = nullptr;
+};
+
+// How each sentence is analyzed
+struct Request {
+  int type = MECAB_ONE_BEST;
+  float theta = 0.75f; // Temperature of marginal probabilities, used with MECAB_MARGINAL_PROB
+};
+
+struct Result {
+  bool succeeded = false;
+  std::string what;
+  std::vector<Token> tokens;
+  size_t number_of_nodes = 0;
+  size_t number_of_unknown_nodes = 0;
+};
+
+// Statistics of analyzed sentences
+struct Counters {
+  size_t sentences = 0;
+  size_t bytes = 0;
+  size_t nodes = 0;
+  size_t unknown_nodes = 0;
+};
+
+std::vector<Sentence> to_sentences(const std::vector<std::string> &sentences);
+
+// Splits a buffer into lines, stripping line breaks
+std::vector<Sentence> split_lines(const char *buffer, size_t size);
+
+// Analyzes sentences with a pool of native threads. Must be called without holding the GIL.
+std::vector<Result> analyze_batch(const MeCab::Tagger &tagger, const std::vector<Sentence> &sentences,
+                                  size_t number_of_threads, const Filter &filter, Unit unit = Unit::CHARACTER,
+                                  const Request &request = Request{});
+
+// Adds the statistics of analyzed sentences to counters
+void count(const std::vector<Sentence> &sentences, const std::vector<Result> &results, Counters &counters);
@@ -0,0 +1,7 @@
+#include "buffer.h"
+
+void initialize_buffer(py::module &m) {
+  py::class_<Buffer>(m, "Buffer", py::buffer_protocol())
+      .def_buffer([](Buffer &self) { return self.info(); })
+      .def("__len__", &Buffer::size);
+}
@@ -0,0 +1,27 @@
+#pragma once
+
+#include <vector>
+
+#include <pybind11/pybind11.h>
+
+namespace py = pybind11;
+
+// A contiguous array exposed to Python through the buffer protocol,
+// so that it can be consumed without copying (e.g. memoryview, numpy.frombuffer or pyarrow.py_buffer)
+class Buffer {
+public:
+  virtual ~Buffer() = default;
+  virtual py::buffer_info info() = 0;
+  virtual size_t size() const = 0;
+};
+
+template <typename T> class Array : public Buffer {
+public:
+  std::vector<T> values;
+
+  py::buffer_info info() override {
+    return py::buffer_info(values.data(), sizeof(T), py::format_descriptor<T>::format(), values.size());
+  }
+
+  size_t size() const override { return values.size(); }
+};
@@ -0,0 +1,53 @@
+#include "columns.h"
+
+#include "posregistry.h"
+
+Columns to_columns(const std::vector<Sentence> &sentences, const std::vector<Result> &results) {
+  Columns columns;
+  PosIds pos_ids;
+
+  size_t number_of_tokens = 0;
+  size_t number_of_bytes = 0;
+  for (const auto &result : results) {
+    number_of_tokens += result.tokens.size();
+    for (const auto &token : result.tokens) {
+      number_of_bytes += token.length;
+    }
+  }
+
+  columns.sentence_offsets->values.reserve(results.size() + 1);
+  columns.starts->values.reserve(number_of_tokens);
+  columns.ends->values.reserve(number_of_tokens);
+  columns.pos_ids->values.reserve(number_of_tokens);
+  columns.surface_offsets->values.reserve(number_of_tokens + 1);
+  columns.surfaces->values.reserve(number_of_bytes);
+
+  columns.sentence_offsets->values.push_back(0);
+  columns.surface_offsets->values.push_back(0);
+  for (size_t index = 0; index < results.size(); index += 1) {
+    const char *sentence = sentences[index].text;
+    for (const auto &token : results[index].tokens) {
+      columns.starts->values.push_back(static_cast<uint32_t>(std::get<0>(token.span)));
+      columns.ends->values.push_back(static_cast<uint32_t>(std::get<1>(token.span)));
+
+      columns.pos_ids->values.push_back(pos_ids(token.feature));
+
+      const uint8_t *surface = reinterpret_cast<const uint8_t *>(sentence + token.offset);
+      columns.surfaces->values.insert(columns.surfaces->values.end(), surface, surface + token.length);
+      columns.surface_offsets->values.push_back(static_cast<int64_t>(columns.surfaces->values.size()));
+    }
+    columns.sentence_offsets->values.push_back(static_cast<int64_t>(columns.starts->values.size()));
+  }
+  columns.pos_tags = pos_registry().snapshot();
+
+  return columns;
+}
+
+py::tuple to_tuple(Columns &&columns) {
+  auto to_object = [](std::unique_ptr<Buffer> buffer) { return py::cast(std::move(buffer)); };
+
+  return py::make_tuple(to_object(std::move(columns.sentence_offsets)), to_object(std::move(columns.starts)),
+                        to_object(std::move(columns.ends)), to_object(std::move(columns.pos_ids)),
+                        py::cast(columns.pos_tags), to_object(std::move(columns.surface_offsets)),
+                        to_object(std::move(columns.surfaces)));
+}
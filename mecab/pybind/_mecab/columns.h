@@ -0,0 +1,29 @@
+#pragma once
+
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <pybind11/pybind11.h>
+
+#include "batch.h"
+#include "buffer.h"
+
+namespace py = pybind11;
+
+// Morphemes of sentences laid out as contiguous arrays
+struct Columns {
+  std::unique_ptr<Array<int64_t>> sentence_offsets{new Array<int64_t>()}; // Index of the first morpheme of each sentence
+  std::unique_ptr<Array<uint32_t>> starts{new Array<uint32_t>()};
+  std::unique_ptr<Array<uint32_t>> ends{new Array<uint32_t>()};
+  std::unique_ptr<Array<uint32_t>> pos_ids{new Array<uint32_t>()};        // Id in the POS registry, indexing pos_tags
+  std::unique_ptr<Array<int64_t>> surface_offsets{new Array<int64_t>()};  // Byte offset of each surface in surfaces
+  std::unique_ptr<Array<uint8_t>> surfaces{new Array<uint8_t>()};         // UTF-8 encoded surfaces
+  std::vector<std::string> pos_tags;
+};
+
+// Does not require the GIL
+Columns to_columns(const std::vector<Sentence> &sentences, const std::vector<Result> &results);
+
+py::tuple to_tuple(Columns &&columns);
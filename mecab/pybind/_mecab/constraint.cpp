@@ -0,0 +1,69 @@
+#include "constraint.h"
+
+#include <algorithm>
+
+#include "utils.h"
+
+std::vector<Constraint> to_constraints(const char *sentence, size_t length,
+                                       const std::vector<CharacterConstraint> &constraints) {
+  std::vector<CharacterConstraint> sorted_constraints(constraints);
+  std::sort(sorted_constraints.begin(), sorted_constraints.end(),
+            [](const CharacterConstraint &lhs, const CharacterConstraint &rhs) {
+              return std::get<0>(lhs) < std::get<0>(rhs);
+            });
+
+  // Spans are sorted, so characters are counted incrementally through the sentence
+  const char *position = sentence;
+  const char *end = sentence + length;
+  size_t character = 0;
+  auto seek = [&](size_t target) {
+    while ((character < target) && (position < end)) {
+      do {
+        position += 1;
+      } while ((position < end) && ((*position & 0xC0) == 0x80)); // Continuation bytes
+      character += 1;
+    }
+    if (character < target) {
+      throw py::value_error("constraint is out of the sentence");
+    }
+    return static_cast<size_t>(position - sentence);
+  };
+
+  std::vector<Constraint> results;
+  results.reserve(sorted_constraints.size());
+  size_t previous_end = 0;
+  size_t previous_end_byte = 0;
+  for (const auto &constraint : sorted_constraints) {
+    size_t start = std::get<0>(constraint);
+    size_t stop = std::get<1>(constraint);
+    if (start >= stop) {
+      throw py::value_error("constraint must not be empty");
+    }
+    if (start < previous_end) {
+      throw py::value_error("constraints must not overlap");
+    }
+    previous_end = stop;
+
+    const char *feature = PyUnicode_AsUTF8(std::get<2>(constraint).ptr());
+    if (feature == nullptr) {
+      throw py::error_already_set();
+    }
+
+    // MeCab looks up a morpheme including its preceding whitespace,
+    // so the constraint must begin where the whitespace begins
+    size_t begin = seek(start);
+    while ((begin > previous_end_byte) && is_space(sentence[begin - 1])) {
+      begin -= 1;
+    }
+    previous_end_byte = seek(stop);
+    results.push_back(Constraint{begin, previous_end_byte, feature});
+  }
+
+  return results;
+}
+
+void set_constraints(MeCab::Lattice &lattice, const std::vector<Constraint> &constraints) {
+  for (const auto &constraint : constraints) {
+    lattice.set_feature_constraint(constraint.begin, constraint.end, constraint.feature);
+  }
+}
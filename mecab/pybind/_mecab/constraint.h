@@ -0,0 +1,27 @@
+#pragma once
+
+#include <tuple>
+#include <vector>
+
+#include <mecab.h>
+#include <pybind11/pybind11.h>
+
+namespace py = pybind11;
+
+// Forces a span of a sentence to be analyzed as a single morpheme
+struct Constraint {
+  size_t begin; // Byte offsets in the sentence
+  size_t end;
+  const char *feature; // Pattern of the feature, where `*` matches any field
+};
+
+// `(start, end, feature)`, where `start` and `end` are character offsets
+typedef std::tuple<size_t, size_t, py::str> CharacterConstraint;
+
+// Converts constraints on character offsets into byte offsets in a UTF-8 sentence.
+// Features refer to the UTF-8 buffers of the given strings, so they must be kept alive while they are used.
+std::vector<Constraint> to_constraints(const char *sentence, size_t length,
+                                       const std::vector<CharacterConstraint> &constraints);
+
+// Must be called after a sentence is set, since setting a sentence clears constraints
+void set_constraints(MeCab::Lattice &lattice, const std::vector<Constraint> &constraints);
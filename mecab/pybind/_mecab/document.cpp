@@ -0,0 +1,198 @@
+#include "document.h"
+
+#include <algorithm>
+#include <cstring>
+#include <string>
+
+#include "utils.h"
+
+// Maximum number of characters shared by adjacent windows
+static const size_t max_overlap = 64;
+
+static size_t utf8_length(char lead) {
+  unsigned char c = static_cast<unsigned char>(lead);
+  if (c < 0x80) {
+    return 1;
+  }
+  if ((c & 0xE0) == 0xC0) {
+    return 2;
+  }
+  if ((c & 0xF0) == 0xE0) {
+    return 3;
+  }
+  if ((c & 0xF8) == 0xF0) {
+    return 4;
+  }
+  return 1;
+}
+
+// Returns the length in bytes of one of `characters` at `position`, or 0 if there is none
+static size_t match(const char *position, const char *end, const std::vector<const char *> &characters) {
+  for (const char *character : characters) {
+    size_t length = std::strlen(character);
+    if ((static_cast<size_t>(end - position) >= length) && (std::memcmp(position, character, length) == 0)) {
+      return length;
+    }
+  }
+  return 0;
+}
+
+static const std::vector<const char *> terminals = {".", "!", "?", "\xE2\x80\xA6", "\xE3\x80\x82", "\xEF\xBC\x81",
+                                                    "\xEF\xBC\x9F"}; // … 。 ！ ？
+static const std::vector<const char *> closers = {"\"", "'", ")", "]", "\xE2\x80\x9D", "\xE2\x80\x99", "\xE3\x80\x8D",
+                                                  "\xE3\x80\x8F"}; // ” ’ 」 』
+
+// Splits a sentence into windows of at most `max_length` characters
+static void split_sentence(const Sentence &sentence, size_t max_length, std::vector<Piece> &pieces) {
+  std::vector<size_t> positions; // Byte offset of each character
+  for (size_t position = 0; position < sentence.length; position += utf8_length(sentence.text[position])) {
+    positions.push_back(position);
+  }
+  const size_t size = positions.size();
+  positions.push_back(sentence.length);
+
+  auto push = [&](size_t start, size_t end, bool overlapped) {
+    Sentence window{sentence.text + positions[start], positions[end] - positions[start], sentence.offset + start};
+    pieces.push_back(Piece{window, sentence.offset + end, overlapped});
+  };
+  auto is_space_at = [&](size_t index) { return is_space(sentence.text[positions[index]]); };
+
+  const size_t overlap = std::min(max_overlap, max_length / 4);
+  size_t start = 0;
+  bool overlapped = false;
+  while (size - start > max_length) {
+    // Cut at the last whitespace in the latter half of the window, which is never inside a morpheme
+    size_t limit = start + max_length;
+    size_t cut = limit;
+    bool found = false;
+    for (size_t index = limit; index > start + max_length / 2; index -= 1) {
+      if (is_space_at(index)) {
+        cut = index;
+        found = true;
+        break;
+      }
+    }
+    push(start, cut, overlapped);
+
+    // The next window begins at a word in the overlap, to analyze the words around the cut in their context
+    size_t next = cut;
+    if (found) {
+      for (size_t index = std::max(start + 1, cut - std::min(cut, overlap)); index < cut; index += 1) {
+        if (is_space_at(index - 1) && !is_space_at(index)) {
+          next = index;
+          break;
+        }
+      }
+    }
+    overlapped = next < cut;
+    start = next;
+  }
+  push(start, size, overlapped);
+}
+
+std::vector<Piece> split_document(const char *document, size_t length, size_t max_length) {
+  std::vector<Piece> pieces;
+
+  const char *end = document + length;
+  const char *position = document;
+  size_t character = 0;
+  auto advance = [&]() {
+    position += utf8_length(*position);
+    character += 1;
+  };
+
+  while (position < end) {
+    while ((position < end) && is_space(*position)) {
+      advance();
+    }
+    if (position == end) {
+      break;
+    }
+
+    // A sentence ends at a line break, or at terminal punctuation followed by whitespace
+    const char *begin = position;
+    size_t begin_character = character;
+    while ((position < end) && (*position != '\n')) {
+      if (match(position, end, terminals) == 0) {
+        advance();
+        continue;
+      }
+      while ((position < end) && (match(position, end, terminals) + match(position, end, closers) > 0)) {
+        advance();
+      }
+      if ((position == end) || is_space(*position)) {
+        break;
+      }
+    }
+
+    const char *sentence_end = position;
+    while ((sentence_end > begin) && is_space(sentence_end[-1])) {
+      sentence_end -= 1;
+    }
+    Sentence sentence{begin, static_cast<size_t>(sentence_end - begin), begin_character};
+    split_sentence(sentence, max_length, pieces);
+  }
+
+  return pieces;
+}
+
+std::vector<Token> stitch(const char *document, const std::vector<Piece> &pieces, const std::vector<Result> &results) {
+  std::vector<Token> tokens;
+  size_t previous_begin = 0; // Index of the first token of the previous piece
+
+  for (size_t index = 0; index < pieces.size(); index += 1) {
+    const Piece &piece = pieces[index];
+    const std::vector<Token> &piece_tokens = results[index].tokens;
+
+    size_t first = 0;
+    if (piece.overlapped) {
+      // Choose a common start of morphemes nearest to the middle of the overlap.
+      // Otherwise, switch to this piece after the end of the previous piece, which is cut at whitespace.
+      size_t start = piece.sentence.offset;
+      size_t end = pieces[index - 1].end;
+      size_t middle = (start + end) / 2;
+      size_t boundary = std::string::npos;
+      size_t other = previous_begin;
+      for (const auto &token : piece_tokens) {
+        size_t token_start = std::get<0>(token.span);
+        if (token_start >= end) {
+          if (boundary == std::string::npos) {
+            boundary = token_start;
+          }
+          break;
+        }
+        while ((other < tokens.size()) && (std::get<0>(tokens[other].span) < token_start)) {
+          other += 1;
+        }
+        if ((other < tokens.size()) && (std::get<0>(tokens[other].span) == token_start)) {
+          size_t distance = (token_start > middle) ? token_start - middle : middle - token_start;
+          size_t best = (boundary > middle) ? boundary - middle : middle - boundary;
+          if ((boundary == std::string::npos) || (distance < best)) {
+            boundary = token_start;
+          }
+        }
+      }
+
+      if (boundary == std::string::npos) {
+        boundary = end;
+      }
+
+      while ((tokens.size() > previous_begin) && (std::get<0>(tokens.back().span) >= boundary)) {
+        tokens.pop_back();
+      }
+      while ((first < piece_tokens.size()) && (std::get<0>(piece_tokens[first].span) < boundary)) {
+        first += 1;
+      }
+    }
+
+    previous_begin = tokens.size();
+    size_t shift = piece.sentence.text - document;
+    for (size_t token_index = first; token_index < piece_tokens.size(); token_index += 1) {
+      Token token = piece_tokens[token_index];
+      token.offset += shift;
+      tokens.push_back(token);
+    }
+  }
+
+  return tokens;
+}
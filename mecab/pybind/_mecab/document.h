@@ -0,0 +1,20 @@
+#pragma once
+
+#include <vector>
+
+#include "batch.h"
+
+// A piece of a document, whose offset is the character offset in the document
+struct Piece {
+  Sentence sentence;
+  size_t end;      // Character offset of the end in the document
+  bool overlapped; // Whether it overlaps with the previous piece, which is a part of the same sentence
+};
+
+// Splits a UTF-8 document into sentences, and sentences longer than `max_length` characters into windows.
+// Windows are cut at whitespace where possible, and overlap each other so that they can be stitched back.
+std::vector<Piece> split_document(const char *document, size_t length, size_t max_length);
+
+// Merges tokens of analyzed pieces, whose offsets become byte offsets in the document.
+// Overlapping pieces are stitched at a morpheme which both of them agree to begin.
+std::vector<Token> stitch(const char *document, const std::vector<Piece> &pieces, const std::vector<Result> &results);
@@ -0,0 +1,93 @@
+#include "featurecache.h"
+
+#include <cstring>
+
+#include "morpheme.h"
+
+FeatureCache::Entry *FeatureCache::find(const char *feature) {
+  auto iterator = entries.find(feature);
+  if (iterator != entries.end()) {
+    Entry &entry = iterator->second;
+    if (std::strcmp(entry.feature.c_str(), feature) == 0) {
+      hits += 1;
+      return &entry;
+    }
+
+    misses += 1;
+    evictions += 1;
+    entry = Entry{feature};
+    return &entry;
+  }
+
+  misses += 1;
+  if (entries.size() >= max_size) {
+    return nullptr;
+  }
+  return &entries.emplace(feature, Entry{feature}).first->second;
+}
+
+py::object FeatureCache::feature(const char *feature) {
+  Entry *entry = find(feature);
+  if (entry == nullptr) {
+    return to_feature(feature);
+  }
+
+  if (!entry->feature_object) {
+    entry->feature_object = to_feature(feature);
+  }
+  return entry->feature_object;
+}
+
+py::object FeatureCache::pos(const char *feature) {
+  Entry *entry = find(feature);
+  if (entry == nullptr) {
+    return to_pos(feature);
+  }
+
+  if (!entry->pos) {
+    entry->pos = to_pos(feature);
+  }
+  return entry->pos;
+}
+
+void FeatureCache::resize(size_t max_size) {
+  this->max_size = max_size;
+  if (entries.size() > max_size) {
+    evictions += entries.size();
+    entries.clear();
+  }
+}
+
+void FeatureCache::clear() { entries.clear(); }
+
+py::tuple FeatureCache::info() const {
+  size_t bytes = 0;
+  for (const auto &item : entries) {
+    const Entry &entry = item.second;
+    bytes += entry.feature.size() + 1;
+    if (entry.feature_object) {
+      bytes += entry.feature_object.attr("__sizeof__")().cast<size_t>();
+      for (const auto &value : entry.feature_object) {
+        if (py::isinstance<py::str>(value)) {
+          bytes += value.attr("__sizeof__")().cast<size_t>();
+        }
+      }
+    }
+    if (entry.pos) {
+      bytes += entry.pos.attr("__sizeof__")().cast<size_t>();
+    }
+  }
+  return py::make_tuple(hits, misses, evictions, entries.size(), bytes);
+}
+
+FeatureCache &feature_cache() {
+  // Never destructed, as it holds Python objects which cannot be freed after the interpreter is finalized
+  static FeatureCache *cache = new FeatureCache(65536);
+  return *cache;
+}
+
+void initialize_featurecache(py::module &m) {
+  m.def("feature_cache_info", []() { return feature_cache().info(); });
+  m.def("resize_feature_cache", [](size_t max_size) { feature_cache().resize(max_size); }, py::arg("max_size"));
+  m.def("clear_feature_cache", []() { feature_cache().clear(); });
+}
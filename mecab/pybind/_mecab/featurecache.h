@@ -0,0 +1,46 @@
+#pragma once
+
+#include <string>
+#include <unordered_map>
+
+#include <pybind11/pybind11.h>
+
+namespace py = pybind11;
+
+// Interns Python objects built from features, so that morphemes of the same dictionary entry share them.
+// Features of dictionary entries are owned by the model, so the nodes of an entry refer to the same feature.
+// Entries are keyed by the pointers to the features, and their contents are compared as well,
+// so a pointer reused for another feature (e.g. after a model is freed) is never mistaken.
+// Must be used with the GIL held.
+class FeatureCache {
+private:
+  struct Entry {
+    std::string feature;
+    py::object feature_object; // mecab.Feature
+    py::object pos;            // Part-of-speech tag
+  };
+
+  std::unordered_map<const char *, Entry> entries;
+  size_t max_size;
+  size_t hits = 0;
+  size_t misses = 0;
+  size_t evictions = 0;
+
+  // Returns the entry for a feature, or nullptr if the cache is full
+  Entry *find(const char *feature);
+
+public:
+  explicit FeatureCache(size_t max_size) : max_size(max_size) {}
+
+  py::object feature(const char *feature);
+  py::object pos(const char *feature);
+
+  void resize(size_t max_size);
+  void clear();
+
+  // Returns `(hits, misses, evictions, entries, estimated size of cached objects in bytes)`
+  py::tuple info() const;
+};
+
+// The process-wide cache, which is shared by every tagger
+FeatureCache &feature_cache();
@@ -0,0 +1,90 @@
+#include "graph.h"
+
+#include <unordered_map>
+
+#include <pybind11/stl.h>
+
+#include "posregistry.h"
+
+Graph to_graph(const MeCab::Lattice &lattice) {
+  Graph graph;
+
+  // Character offset of each byte offset in the sentence
+  const char *sentence = lattice.sentence();
+  const size_t size = lattice.size();
+  std::vector<uint32_t> characters(size + 1);
+  uint32_t character = 0;
+  for (size_t index = 0; index < size; index += 1) {
+    characters[index] = character;
+    if ((sentence[index] & 0xC0) != 0x80) { // Not a continuation byte
+      character += 1;
+    }
+  }
+  characters[size] = character;
+
+  std::vector<const MeCab::Node *> nodes;
+  nodes.push_back(lattice.bos_node());
+  for (size_t position = 0; position < size; position += 1) {
+    for (const MeCab::Node *node = lattice.begin_nodes(position); node != nullptr; node = node->bnext) {
+      nodes.push_back(node);
+    }
+  }
+  nodes.push_back(lattice.eos_node());
+
+  std::unordered_map<const MeCab::Node *, uint32_t> node_ids;
+  PosIds pos_ids;
+  node_ids.reserve(nodes.size());
+  graph.starts->values.reserve(nodes.size());
+  graph.ends->values.reserve(nodes.size());
+  graph.pos_ids->values.reserve(nodes.size());
+
+  for (const MeCab::Node *node : nodes) {
+    node_ids.emplace(node, static_cast<uint32_t>(node_ids.size()));
+
+    // BOS and EOS do not refer to the sentence
+    size_t start = 0;
+    size_t end = 0;
+    if (node->stat == MECAB_EOS_NODE) {
+      start = end = size;
+    } else if (node->stat != MECAB_BOS_NODE) {
+      start = node->surface - sentence;
+      end = start + node->length;
+    }
+    graph.starts->values.push_back(characters[start]);
+    graph.ends->values.push_back(characters[end]);
+
+    graph.pos_ids->values.push_back(pos_ids(node->feature));
+
+    graph.stats->values.push_back(node->stat);
+    graph.best->values.push_back(node->isbest);
+    graph.word_costs->values.push_back(node->wcost);
+    graph.costs->values.push_back(node->cost);
+    graph.probabilities->values.push_back(node->prob);
+  }
+
+  for (const MeCab::Node *node : nodes) {
+    for (const MeCab::Path *path = node->lpath; path != nullptr; path = path->lnext) {
+      auto left = node_ids.find(path->lnode);
+      if (left == node_ids.end()) {
+        continue;
+      }
+      graph.path_lefts->values.push_back(left->second);
+      graph.path_rights->values.push_back(node_ids[node]);
+      graph.path_costs->values.push_back(path->cost);
+    }
+  }
+
+  graph.pos_tags = pos_registry().snapshot();
+  return graph;
+}
+
+py::tuple to_tuple(Graph &&graph) {
+  auto to_object = [](std::unique_ptr<Buffer> buffer) { return py::cast(std::move(buffer)); };
+
+  return py::make_tuple(to_object(std::move(graph.starts)), to_object(std::move(graph.ends)),
+                        to_object(std::move(graph.pos_ids)), py::cast(graph.pos_tags),
+                        to_object(std::move(graph.stats)), to_object(std::move(graph.best)),
+                        to_object(std::move(graph.word_costs)), to_object(std::move(graph.costs)),
+                        to_object(std::move(graph.probabilities)), to_object(std::move(graph.path_lefts)),
+                        to_object(std::move(graph.path_rights)), to_object(std::move(graph.path_costs)));
+}
@@ -0,0 +1,35 @@
+#pragma once
+
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <mecab.h>
+#include <pybind11/pybind11.h>
+
+#include "buffer.h"
+
+namespace py = pybind11;
+
+// Every node and path of a lattice laid out as contiguous arrays.
+// Nodes are ordered by their start positions, from BOS to EOS.
+struct Graph {
+  std::unique_ptr<Array<uint32_t>> starts{new Array<uint32_t>()};
+  std::unique_ptr<Array<uint32_t>> ends{new Array<uint32_t>()};
+  std::unique_ptr<Array<uint32_t>> pos_ids{new Array<uint32_t>()}; // Id in the POS registry, indexing pos_tags
+  std::unique_ptr<Array<uint8_t>> stats{new Array<uint8_t>()};     // MECAB_NOR_NODE, MECAB_UNK_NODE, ...
+  std::unique_ptr<Array<uint8_t>> best{new Array<uint8_t>()};      // Whether the node is in the best path
+  std::unique_ptr<Array<int32_t>> word_costs{new Array<int32_t>()};
+  std::unique_ptr<Array<int64_t>> costs{new Array<int64_t>()};     // Cost of the best path from BOS to the node
+  std::unique_ptr<Array<float>> probabilities{new Array<float>()};  // Marginal probability, if requested
+  std::unique_ptr<Array<uint32_t>> path_lefts{new Array<uint32_t>()};  // Index of the left node of each path
+  std::unique_ptr<Array<uint32_t>> path_rights{new Array<uint32_t>()}; // Index of the right node of each path
+  std::unique_ptr<Array<int32_t>> path_costs{new Array<int32_t>()};    // Including the word cost of the right node
+  std::vector<std::string> pos_tags;
+};
+
+// Requires MECAB_ALL_MORPHS, and MECAB_NBEST or MECAB_MARGINAL_PROB to keep the paths. Does not require the GIL
+Graph to_graph(const MeCab::Lattice &lattice);
+
+py::tuple to_tuple(Graph &&graph);
@@ -1,37 +1,34 @@
 #include <sstream>
+#include <unordered_map>
 
 #include <mecab.h>
 #include <pybind11/pybind11.h>
 
+#include "constraint.h"
+#include "graph.h"
+#include "lattice.h"
+#include "morpheme.h"
 #include "utils.h"
 
 namespace py = pybind11;
 
-typedef std::tuple<size_t, size_t> Span;
-
-class Iterator {
-private:
-  const MeCab::Node *cursor;
-  const char *sentence;
-
-public:
-  explicit Iterator(const MeCab::Node *cursor) : cursor(cursor), sentence(cursor->surface) {}
-
-  const std::tuple<const Span, const MeCab::Node &> operator*() const {
-    size_t offset = cursor->surface - sentence;
-
-    return std::make_tuple(
-        Span{utf8_strlen(sentence, sentence + offset), utf8_strlen(sentence, sentence + offset + cursor->length)},
-        std::cref(*cursor));
+// Returns the total cost of the current path, which is the sum of the costs of words and connections.
+// Costs of nodes are not updated for n-best paths, so they are summed up from the paths between nodes.
+static long path_cost(const MeCab::Lattice &lattice) {
+  long cost = 0;
+  for (const MeCab::Node *node = lattice.bos_node()->next; node != nullptr; node = node->next) {
+    for (const MeCab::Path *path = node->lpath; path != nullptr; path = path->lnext) {
+      if (path->lnode == node->prev) {
+        cost += path->cost; // Including the cost of the word
+        break;
+      }
+    }
+    if (node->stat == MECAB_EOS_NODE) {
+      break;
+    }
   }
-
-  Iterator &operator++() {
-    cursor = cursor->next;
-    return *this;
-  }
-
-  bool operator==(const Iterator &rhs) const { return cursor == rhs.cursor; }
-};
+  return cost;
+}
 
 void initialize_lattice(py::module &m) {
   // Parameters for MeCab::Lattice::request_type
@@ -60,9 +57,42 @@ void initialize_lattice(py::module &m) {
       .def("end_nodes", py::overload_cast<size_t>(&MeCab::Lattice::end_nodes, py::const_),
            py::return_value_policy::reference)
       .def("sentence", &MeCab::Lattice::sentence)
-      .def("set_sentence", py::overload_cast<const char *>(&MeCab::Lattice::set_sentence))
+      // Unless MECAB_ALLOCATE_SENTENCE is requested, the lattice refers to the UTF-8 buffer of the given sentence
+      // instead of copying it, so the sentence must be kept alive while the lattice is used.
+      .def("set_sentence",
+           [](MeCab::Lattice &self, const py::str &sentence) {
+             Py_ssize_t size;
+             const char *buffer = PyUnicode_AsUTF8AndSize(sentence.ptr(), &size);
+             if (buffer == nullptr) {
+               throw py::error_already_set();
+             }
+             self.set_sentence(buffer, size);
+           })
+      .def("set_sentence",
+           [](MeCab::Lattice &self, const py::bytes &sentence) {
+             self.set_sentence(PyBytes_AS_STRING(sentence.ptr()), PyBytes_GET_SIZE(sentence.ptr()));
+           })
       .def("set_sentence", py::overload_cast<const char *, size_t>(&MeCab::Lattice::set_sentence))
       .def("size", &MeCab::Lattice::size)
+      // Returns `(number of nodes, number of unknown nodes)` in the best path
+      .def("count_nodes",
+           [](const MeCab::Lattice &self) {
+             size_t nodes = 0;
+             size_t unknown_nodes = 0;
+             if (!self.is_available()) {
+               return std::make_tuple(nodes, unknown_nodes);
+             }
+             for (const MeCab::Node *node = self.bos_node()->next; node->stat != MECAB_EOS_NODE; node = node->next) {
+               if (!node->isbest) { // Every node is linked if MECAB_ALL_MORPHS is requested
+                 continue;
+               }
+               nodes += 1;
+               if (node->stat == MECAB_UNK_NODE) {
+                 unknown_nodes += 1;
+               }
+             }
+             return std::make_tuple(nodes, unknown_nodes);
+           })
       .def("set_Z", &MeCab::Lattice::set_Z)
       .def("Z", &MeCab::Lattice::Z)
       .def("set_theta", &MeCab::Lattice::set_theta)
@@ -88,14 +118,105 @@ void initialize_lattice(py::module &m) {
       .def("set_boundary_constraint", &MeCab::Lattice::set_boundary_constraint)
       .def("set_feature_constraint", &MeCab::Lattice::set_feature_constraint)
       .def("set_result", &MeCab::Lattice::set_result)
+      // Forces spans of `(start, end, feature)` on character offsets to be single morphemes matching the features.
+      // Must be called after a sentence is set. The features are referred without copying,
+      // so they must be kept alive while the lattice is used.
+      .def("set_constraints",
+           [](MeCab::Lattice &self, const std::vector<CharacterConstraint> &constraints) {
+             set_constraints(self, to_constraints(self.sentence(), self.size(), constraints));
+           })
+      // Returns `(starts, ends, pos_ids, pos_tags, stats, best, word_costs, costs, probabilities,
+      //           path_lefts, path_rights, path_costs)` of every node and path.
+      // Requires MECAB_ALL_MORPHS, and MECAB_NBEST or MECAB_MARGINAL_PROB to keep the paths
+      .def("graph",
+           [](const MeCab::Lattice &self) {
+             if (!self.is_available()) {
+               throw std::runtime_error("lattice is not analyzed");
+             }
+             Graph graph;
+             {
+               py::gil_scoped_release release;
+               graph = to_graph(self);
+             }
+             return to_tuple(std::move(graph));
+           })
       .def("what", &MeCab::Lattice::what, py::return_value_policy::copy)
       .def("set_what", &MeCab::Lattice::set_what)
+      // Returns a list of `mecab.Morpheme` in the best path
+      .def(
+          "morphemes",
+          [](const MeCab::Lattice &self, const std::vector<std::string> &include_pos,
+             const std::vector<std::string> &exclude_pos) {
+            return to_outputs(Output::MORPHEME, self, Filter{include_pos, exclude_pos});
+          },
+          py::arg("include_pos") = std::vector<std::string>{}, py::arg("exclude_pos") = std::vector<std::string>{})
+      // Returns a list of `(mecab.Morpheme, marginal probability)` in the best path.
+      // MECAB_MARGINAL_PROB must be requested before parsing.
+      .def(
+          "confidences",
+          [](const MeCab::Lattice &self, const std::vector<std::string> &include_pos,
+             const std::vector<std::string> &exclude_pos) {
+            return to_outputs(Output::CONFIDENCE, self, Filter{include_pos, exclude_pos});
+          },
+          py::arg("include_pos") = std::vector<std::string>{}, py::arg("exclude_pos") = std::vector<std::string>{})
+      // Returns a list of `(surface, part-of-speech tag)` in the best path
+      .def(
+          "pos",
+          [](const MeCab::Lattice &self, const std::vector<std::string> &include_pos,
+             const std::vector<std::string> &exclude_pos) {
+            return to_outputs(Output::POS, self, Filter{include_pos, exclude_pos});
+          },
+          py::arg("include_pos") = std::vector<std::string>{}, py::arg("exclude_pos") = std::vector<std::string>{})
+      // Returns a list of surfaces in the best path
+      .def(
+          "surfaces",
+          [](const MeCab::Lattice &self, const std::vector<std::string> &include_pos,
+             const std::vector<std::string> &exclude_pos) {
+            return to_outputs(Output::SURFACE, self, Filter{include_pos, exclude_pos});
+          },
+          py::arg("include_pos") = std::vector<std::string>{}, py::arg("exclude_pos") = std::vector<std::string>{})
+      // Returns a list of `(list of mecab.Morpheme, cost)` for the next `n` best paths.
+      // MECAB_NBEST must be requested before parsing. Nodes shared by paths are converted only once.
+      .def(
+          "nbest",
+          [](MeCab::Lattice &self, size_t n) {
+            py::list results;
+            std::unordered_map<const MeCab::Node *, py::object> morphemes;
+            for (size_t index = 0; index < n; index += 1) {
+              bool found;
+              {
+                py::gil_scoped_release release;
+                found = self.next();
+              }
+              if (!found) {
+                break;
+              }
+
+              py::list outputs;
+              Iterator iterator(self.bos_node()->next, self.sentence());
+              Iterator end(self.eos_node(), self.sentence());
+              for (; iterator != end; ++iterator) {
+                const auto &token = *iterator;
+                const MeCab::Node &node = std::get<1>(token);
+                auto morpheme = morphemes.find(&node);
+                if (morpheme == morphemes.end()) {
+                  py::object output =
+                      to_output(Output::MORPHEME, std::get<0>(token), node.surface, node.length, node.feature);
+                  morpheme = morphemes.emplace(&node, std::move(output)).first;
+                }
+                outputs.append(morpheme->second);
+              }
+              results.append(py::make_tuple(outputs, path_cost(self)));
+            }
+            return results;
+          },
+          py::arg("n"))
       .def("__len__", &MeCab::Lattice::size)
       .def(
           "__iter__",
           [](const MeCab::Lattice &self) {
-            Iterator begin = Iterator(self.bos_node()->next);
-            Iterator end = Iterator(self.eos_node());
+            Iterator begin = Iterator(self.bos_node()->next, self.sentence());
+            Iterator end = Iterator(self.eos_node(), self.sentence());
             return py::make_iterator(begin, end);
           },
           py::keep_alive<0, 1>()) // 0 -> iterator, 1 -> self
@@ -0,0 +1,66 @@
+#pragma once
+
+#include <tuple>
+
+#include <mecab.h>
+
+#include "utils.h"
+
+typedef std::tuple<size_t, size_t> Span;
+
+// Unit of spans
+enum class Unit {
+  CHARACTER, // Index of Unicode code points, as in Python strings
+  BYTE,      // Index of bytes in UTF-8
+};
+
+class Iterator {
+private:
+  const MeCab::Node *cursor;
+  const char *sentence;
+  Unit unit;
+
+  // Characters are counted incrementally from where the previous node ended,
+  // so iterating a whole lattice is linear in the length of the sentence.
+  const char *position;
+  size_t length;
+  Span span;
+
+  void count() {
+    if (cursor->stat == MECAB_EOS_NODE) {
+      return;
+    }
+
+    if (unit == Unit::BYTE) {
+      size_t start = cursor->surface - sentence;
+      span = Span{start, start + cursor->length};
+      return;
+    }
+
+    size_t start = length + utf8_strlen(position, cursor->surface);
+    size_t end = start + utf8_strlen(cursor->surface, cursor->surface + cursor->length);
+
+    position = cursor->surface + cursor->length;
+    length = end;
+    span = Span{start, end};
+  }
+
+public:
+  Iterator(const MeCab::Node *cursor, const char *sentence, Unit unit = Unit::CHARACTER)
+      : cursor(cursor), sentence(sentence), unit(unit), position(sentence), length(0) {
+    count();
+  }
+
+  const std::tuple<const Span, const MeCab::Node &> operator*() const {
+    return std::make_tuple(span, std::cref(*cursor));
+  }
+
+  Iterator &operator++() {
+    cursor = cursor->next;
+    count();
+    return *this;
+  }
+
+  bool operator==(const Iterator &rhs) const { return cursor == rhs.cursor; }
+  bool operator!=(const Iterator &rhs) const { return cursor != rhs.cursor; }
+};
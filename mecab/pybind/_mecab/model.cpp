@@ -0,0 +1,40 @@
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <mecab.h>
+#include <pybind11/pybind11.h>
+
+#include "utils.h"
+
+namespace py = pybind11;
+
+void initialize_model(py::module &m) {
+  // Reference: https://taku910.github.io/mecab/doxygen/classMeCab_1_1Model.html
+  py::class_<MeCab::Model>(m, "Model")
+      .def(py::init([](const std::vector<std::string> &arguments) {
+             std::vector<char *> argv = to_argv(arguments);
+             MeCab::Model *model;
+             {
+               // Loading dictionaries does not touch any Python object
+               py::gil_scoped_release release;
+               model = MeCab::Model::create(argv.size(), argv.data());
+             }
+             if (model == nullptr) {
+               throw pybind11::value_error(MeCab::getLastError());
+             }
+
+             return std::unique_ptr<MeCab::Model>(model);
+           }))
+      // Taggers and lattices refer to the model, so the model must outlive them
+      .def(
+          "create_tagger", [](const MeCab::Model &self) { return std::unique_ptr<MeCab::Tagger>(self.createTagger()); },
+          py::keep_alive<0, 1>())
+      .def(
+          "create_lattice",
+          [](const MeCab::Model &self) { return std::unique_ptr<MeCab::Lattice>(self.createLattice()); },
+          py::keep_alive<0, 1>())
+      .def("dictionary_info", &MeCab::Model::dictionary_info, py::return_value_policy::reference_internal)
+      .def("transition_cost", &MeCab::Model::transition_cost)
+      .def_static("version", &MeCab::Model::version);
+}
@@ -0,0 +1,161 @@
+#include "morpheme.h"
+
+#include <cstring>
+
+#include "featurecache.h"
+
+// Types in `mecab.types` are built directly from native code, so that
+// no Python code runs for each morpheme.
+static PyObject *span_type = nullptr;
+static PyObject *feature_type = nullptr;
+static PyObject *morpheme_type = nullptr;
+
+static void load_types() {
+  if (morpheme_type != nullptr) {
+    return;
+  }
+
+  py::module types = py::module::import("mecab.types");
+  span_type = py::object(types.attr("Span")).release().ptr();
+  feature_type = py::object(types.attr("Feature")).release().ptr();
+  morpheme_type = py::object(types.attr("Morpheme")).release().ptr();
+}
+
+// Equivalent to `tuple.__new__(type, values)`, which is how NamedTuple instances are created
+static py::object make_namedtuple(PyObject *type, const py::tuple &values) {
+  py::tuple arguments = py::make_tuple(values);
+  PyObject *instance = PyTuple_Type.tp_new(reinterpret_cast<PyTypeObject *>(type), arguments.ptr(), nullptr);
+  if (instance == nullptr) {
+    throw py::error_already_set();
+  }
+  return py::reinterpret_steal<py::object>(instance);
+}
+
+static py::object to_value(const char *begin, const char *end) {
+  if ((end - begin == 1) && (*begin == '*')) {
+    return py::none();
+  }
+  return py::str(begin, end - begin);
+}
+
+py::object to_feature(const char *feature) {
+  // Reference: Feature._from_feature() in mecab/types.py
+  // feature = <pos>,<semantic>,<has_jongseong>,<reading>,<type>,<start_pos>,<end_pos>,<expression>
+  constexpr size_t number_of_fields = 8;
+
+  const char *delimiters[number_of_fields];
+  size_t index = 0;
+  for (const char *iterator = feature; index < number_of_fields; iterator += 1) {
+    if ((*iterator == ',') || (*iterator == '\0')) {
+      delimiters[index++] = iterator;
+      if (*iterator == '\0') {
+        break;
+      }
+    }
+  }
+
+  load_types();
+  if ((index != number_of_fields) || (*delimiters[number_of_fields - 1] != '\0')) {
+    // Let Feature._from_feature() handle a malformed feature
+    return py::handle(feature_type).attr("_from_feature")(feature);
+  }
+
+  const char *begin = feature;
+  py::tuple values(number_of_fields);
+  for (index = 0; index < number_of_fields; index += 1) {
+    const char *end = delimiters[index];
+    if (index == 2) { // has_jongseong
+      if ((end - begin == 1) && (*begin == 'T')) {
+        values[index] = py::bool_(true);
+      } else if ((end - begin == 1) && (*begin == 'F')) {
+        values[index] = py::bool_(false);
+      } else {
+        values[index] = to_value(begin, end);
+      }
+    } else {
+      values[index] = to_value(begin, end);
+    }
+    begin = end + 1;
+  }
+
+  return make_namedtuple(feature_type, values);
+}
+
+static bool starts_with(const char *text, const std::string &prefix) {
+  return std::strncmp(text, prefix.c_str(), prefix.size()) == 0;
+}
+
+static bool starts_with_any(const char *text, const std::vector<std::string> &prefixes) {
+  for (const auto &prefix : prefixes) {
+    if (starts_with(text, prefix)) {
+      return true;
+    }
+  }
+  return false;
+}
+
+bool Filter::operator()(const char *feature) const {
+  if (!include_pos.empty() && !starts_with_any(feature, include_pos)) {
+    return false;
+  }
+  return exclude_pos.empty() || !starts_with_any(feature, exclude_pos);
+}
+
+py::str to_pos(const char *feature) {
+  const char *end = std::strchr(feature, ',');
+  return (end != nullptr) ? py::str(feature, end - feature) : py::str(feature);
+}
+
+static py::object to_morpheme(const Span &span, const char *surface, size_t length, const char *feature,
+                              bool intern) {
+  load_types();
+  py::object morpheme_span = make_namedtuple(span_type, py::make_tuple(std::get<0>(span), std::get<1>(span)));
+  py::object morpheme_feature = intern ? feature_cache().feature(feature) : to_feature(feature);
+  return make_namedtuple(morpheme_type, py::make_tuple(morpheme_span, py::str(surface, length), morpheme_feature));
+}
+
+py::object to_output(Output output, const Span &span, const char *surface, size_t length, const char *feature,
+                     float prob, bool intern) {
+  switch (output) {
+  case Output::POS:
+    return py::make_tuple(py::str(surface, length), intern ? py::object(feature_cache().pos(feature)) : to_pos(feature));
+  case Output::SURFACE:
+    return py::str(surface, length);
+  case Output::CONFIDENCE:
+    return py::make_tuple(to_morpheme(span, surface, length, feature, intern), prob);
+  default:
+    return to_morpheme(span, surface, length, feature, intern);
+  }
+}
+
+bool is_internable(const MeCab::Lattice &lattice, const MeCab::Node &node) {
+  return (node.stat != MECAB_UNK_NODE) || !lattice.has_constraint();
+}
+
+py::list to_outputs(Output output, const MeCab::Lattice &lattice, const Filter &filter) {
+  py::list outputs;
+
+  Iterator iterator(lattice.bos_node()->next, lattice.sentence());
+  Iterator end(lattice.eos_node(), lattice.sentence());
+  for (; iterator != end; ++iterator) {
+    const auto &token = *iterator;
+    const MeCab::Node &node = std::get<1>(token);
+    if (filter(node.feature)) {
+      outputs.append(to_output(output, std::get<0>(token), node.surface, node.length, node.feature, node.prob,
+                               is_internable(lattice, node)));
+    }
+  }
+
+  return outputs;
+}
+
+py::list to_outputs(Output output, const char *sentence, const std::vector<Token> &tokens) {
+  py::list outputs(tokens.size());
+  for (size_t index = 0; index < tokens.size(); index += 1) {
+    const Token &token = tokens[index];
+    outputs[index] =
+        to_output(output, token.span, sentence + token.offset, token.length, token.feature, token.prob, token.intern);
+  }
+
+  return outputs;
+}
@@ -0,0 +1,47 @@
+#pragma once
+
+#include <string>
+#include <vector>
+
+#include <mecab.h>
+#include <pybind11/pybind11.h>
+
+#include "lattice.h"
+
+namespace py = pybind11;
+
+struct Token {
+  Span span;
+  size_t offset; // Byte offset of the surface in the sentence
+  size_t length;
+  const char *feature;
+  float prob;  // Marginal probability, if requested
+  bool intern; // Whether the feature is owned by the model, so that its objects can be interned
+};
+
+// What to build for each morpheme
+enum class Output {
+  MORPHEME,   // mecab.Morpheme
+  POS,        // (surface, part-of-speech tag)
+  SURFACE,    // surface
+  CONFIDENCE, // (mecab.Morpheme, marginal probability)
+};
+
+// Selects morphemes by the prefixes of their part-of-speech tags.
+// A morpheme is selected if its tag starts with any of `include_pos` (or `include_pos` is empty),
+// and does not start with any of `exclude_pos`.
+struct Filter {
+  std::vector<std::string> include_pos;
+  std::vector<std::string> exclude_pos;
+
+  bool operator()(const char *feature) const;
+};
+
+py::object to_feature(const char *feature);
+py::str to_pos(const char *feature);
+py::object to_output(Output output, const Span &span, const char *surface, size_t length, const char *feature,
+                     float prob = 0.0f, bool intern = true);
+// Features of unknown nodes in a lattice with constraints may be owned by the constraints, so they are not interned
+bool is_internable(const MeCab::Lattice &lattice, const MeCab::Node &node);
+py::list to_outputs(Output output, const MeCab::Lattice &lattice, const Filter &filter);
+py::list to_outputs(Output output, const char *sentence, const std::vector<Token> &tokens);
@@ -0,0 +1,59 @@
+#include "posregistry.h"
+
+#include <cstring>
+
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+namespace py = pybind11;
+
+// Reference: left-id.def of mecab-ko-dic
+static const char *const tags_of_dictionary[] = {
+    "BOS/EOS", "EC",  "EF",  "EP",  "ETM", "ETN",  "IC",  "JC",  "JKB", "JKC", "JKG", "JKO", "JKQ",
+    "JKS",     "JKV", "JX",  "MAG", "MAJ", "MM",   "NA",  "NNB", "NNBC", "NNG", "NNP", "NP",  "NR",
+    "SC",      "SE",  "SF",  "SH",  "SL",  "SN",   "SP",  "SSC", "SSO", "SY",  "UNA", "UNKNOWN", "VA",
+    "VCN",     "VCP", "VSV", "VV",  "VX",  "XPN",  "XR",  "XSA", "XSN", "XSV",
+};
+
+PosRegistry::PosRegistry() {
+  for (const char *tag : tags_of_dictionary) {
+    id(tag);
+  }
+}
+
+uint32_t PosRegistry::id(const std::string &tag) {
+  std::lock_guard<std::mutex> lock(mutex);
+  auto inserted = ids.emplace(tag, static_cast<uint32_t>(tags.size()));
+  if (inserted.second) {
+    tags.push_back(tag);
+  }
+  return inserted.first->second;
+}
+
+std::vector<std::string> PosRegistry::snapshot() const {
+  std::lock_guard<std::mutex> lock(mutex);
+  return tags;
+}
+
+PosRegistry &pos_registry() {
+  static PosRegistry *registry = new PosRegistry();
+  return *registry;
+}
+
+uint32_t PosIds::operator()(const char *feature) {
+  auto iterator = ids.find(feature);
+  if (iterator != ids.end()) {
+    return iterator->second;
+  }
+
+  const char *end = std::strchr(feature, ',');
+  std::string pos = (end != nullptr) ? std::string(feature, end) : std::string(feature);
+  uint32_t id = pos_registry().id(pos);
+  ids.emplace(feature, id);
+  return id;
+}
+
+void initialize_posregistry(py::module &m) {
+  m.def("pos_id", [](const std::string &tag) { return pos_registry().id(tag); }, py::arg("tag"));
+  m.def("pos_tags", []() { return pos_registry().snapshot(); });
+}
@@ -0,0 +1,39 @@
+#pragma once
+
+#include <cstdint>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+// Assigns an integer id to each part-of-speech tag, which is kept for the lifetime of the process.
+// Tags of mecab-ko-dic have the same ids in every process, and other tags (e.g. "VV+EC") are added as they appear.
+// Thread-safe, and does not require the GIL
+class PosRegistry {
+private:
+  mutable std::mutex mutex;
+  std::unordered_map<std::string, uint32_t> ids;
+  std::vector<std::string> tags;
+
+public:
+  PosRegistry();
+
+  // Returns the id of a tag, adding the tag if it is not registered yet
+  uint32_t id(const std::string &tag);
+
+  // Returns the registered tags, indexed by their ids
+  std::vector<std::string> snapshot() const;
+};
+
+// The process-wide registry
+PosRegistry &pos_registry();
+
+// Returns the ids of the tags of features, remembering them by the pointers to the features,
+// so that the registry is consulted only once for each feature
+class PosIds {
+private:
+  std::unordered_map<const char *, uint32_t> ids;
+
+public:
+  uint32_t operator()(const char *feature);
+};
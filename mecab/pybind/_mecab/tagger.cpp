@@ -1,15 +1,52 @@
 #include <memory>
+#include <stdexcept>
 #include <string>
 #include <vector>
 
 #include <mecab.h>
 #include <pybind11/pybind11.h>
 
+#include "batch.h"
+#include "columns.h"
+#include "document.h"
+#include "morpheme.h"
 #include "utils.h"
 
 namespace py = pybind11;
 
+// Returns a list of outputs for each sentence
+static py::list parse_batch(const MeCab::Tagger &tagger, const std::vector<Sentence> &sentences,
+                            size_t number_of_threads, Output output, const Filter &filter, Counters *counters,
+                            Unit unit = Unit::CHARACTER, const Request &request = Request{}) {
+  std::vector<Result> results;
+  {
+    py::gil_scoped_release release;
+    results = analyze_batch(tagger, sentences, number_of_threads, filter, unit, request);
+  }
+  if (counters != nullptr) {
+    count(sentences, results, *counters);
+  }
+
+  py::list list_of_outputs(results.size());
+  for (size_t index = 0; index < results.size(); index += 1) {
+    const Result &result = results[index];
+    if (!result.succeeded) {
+      throw std::runtime_error(result.what);
+    }
+    list_of_outputs[index] = to_outputs(output, sentences[index].text, result.tokens);
+  }
+  return list_of_outputs;
+}
+
 void initialize_tagger(py::module &m) {
+  // Statistics filled by batch methods if given as `counters`
+  py::class_<Counters>(m, "Counters")
+      .def(py::init<>())
+      .def_readonly("sentences", &Counters::sentences)
+      .def_readonly("bytes", &Counters::bytes)
+      .def_readonly("nodes", &Counters::nodes)
+      .def_readonly("unknown_nodes", &Counters::unknown_nodes);
+
   // Reference: https://taku910.github.io/mecab/doxygen/classMeCab_1_1Tagger.html
   py::class_<MeCab::Tagger>(m, "Tagger")
       .def(py::init([](const std::vector<std::string> &arguments) {
@@ -22,10 +59,151 @@ void initialize_tagger(py::module &m) {
         return std::unique_ptr<MeCab::Tagger>(tagger);
       }))
       .def("parse", py::overload_cast<const char *>(&MeCab::Tagger::parse), py::return_value_policy::reference)
-      .def("parse", py::overload_cast<MeCab::Lattice *>(&MeCab::Tagger::parse, py::const_))
+      // Parsing a lattice only reads the model, so the GIL can be released while the lattice is analyzed.
+      // Multiple threads can share a tagger as long as each of them uses its own lattice.
+      .def("parse", py::overload_cast<MeCab::Lattice *>(&MeCab::Tagger::parse, py::const_),
+           py::call_guard<py::gil_scoped_release>())
+      .def(
+          "parse_batch",
+          [](const MeCab::Tagger &self, const std::vector<std::string> &sentences, size_t number_of_threads,
+             const std::vector<std::string> &include_pos, Counters *counters, const py::object &theta,
+             const py::object &constraints, const std::vector<std::string> &exclude_pos) {
+            Filter filter{include_pos, exclude_pos};
+            std::vector<Sentence> views = to_sentences(sentences);
+
+            // Constraints for each sentence, which refer to the features in `list_of_character_constraints`
+            std::vector<std::vector<CharacterConstraint>> list_of_character_constraints;
+            std::vector<std::vector<Constraint>> list_of_constraints;
+            if (!constraints.is_none()) {
+              list_of_character_constraints = constraints.cast<std::vector<std::vector<CharacterConstraint>>>();
+              if (list_of_character_constraints.size() != sentences.size()) {
+                throw py::value_error("constraints must be given for each sentence");
+              }
+              for (size_t index = 0; index < sentences.size(); index += 1) {
+                list_of_constraints.push_back(
+                    to_constraints(views[index].text, views[index].length, list_of_character_constraints[index]));
+              }
+              for (size_t index = 0; index < sentences.size(); index += 1) {
+                views[index].constraints = &list_of_constraints[index];
+              }
+            }
+
+            if (theta.is_none()) {
+              return parse_batch(self, views, number_of_threads, Output::MORPHEME, filter, counters);
+            }
+
+            // Returns `(mecab.Morpheme, marginal probability)` for each morpheme instead
+            Request request{MECAB_MARGINAL_PROB, theta.cast<float>()};
+            return parse_batch(self, views, number_of_threads, Output::CONFIDENCE, filter, counters, Unit::CHARACTER,
+                               request);
+          },
+          py::arg("sentences"), py::arg("number_of_threads") = 1, py::arg("include_pos") = std::vector<std::string>{},
+          py::arg("counters") = nullptr, py::arg("theta") = py::none(), py::arg("constraints") = py::none(),
+          py::arg("exclude_pos") = std::vector<std::string>{})
+      .def(
+          "pos_batch",
+          [](const MeCab::Tagger &self, const std::vector<std::string> &sentences, size_t number_of_threads,
+             const std::vector<std::string> &include_pos, Counters *counters,
+             const std::vector<std::string> &exclude_pos) {
+            return parse_batch(self, to_sentences(sentences), number_of_threads, Output::POS,
+                               Filter{include_pos, exclude_pos}, counters);
+          },
+          py::arg("sentences"), py::arg("number_of_threads") = 1, py::arg("include_pos") = std::vector<std::string>{},
+          py::arg("counters") = nullptr, py::arg("exclude_pos") = std::vector<std::string>{})
+      .def(
+          "surfaces_batch",
+          [](const MeCab::Tagger &self, const std::vector<std::string> &sentences, size_t number_of_threads,
+             const std::vector<std::string> &include_pos, Counters *counters,
+             const std::vector<std::string> &exclude_pos) {
+            return parse_batch(self, to_sentences(sentences), number_of_threads, Output::SURFACE,
+                               Filter{include_pos, exclude_pos}, counters);
+          },
+          py::arg("sentences"), py::arg("number_of_threads") = 1, py::arg("include_pos") = std::vector<std::string>{},
+          py::arg("counters") = nullptr, py::arg("exclude_pos") = std::vector<std::string>{})
+      // Returns a list of `mecab.Morpheme` for each line in a UTF-8 encoded buffer.
+      // If `offset` is given, spans are byte offsets from the start of the buffer plus `offset`
+      // instead of character offsets in each line.
+      .def(
+          "parse_lines",
+          [](const MeCab::Tagger &self, const py::buffer &buffer, size_t number_of_threads,
+             const py::object &offset, Counters *counters) {
+            py::buffer_info info = buffer.request();
+            std::vector<Sentence> lines = split_lines(static_cast<const char *>(info.ptr), info.size * info.itemsize);
+
+            if (offset.is_none()) {
+              for (auto &line : lines) {
+                line.offset = 0;
+              }
+              return parse_batch(self, lines, number_of_threads, Output::MORPHEME, Filter{}, counters);
+            }
+
+            size_t base = offset.cast<size_t>();
+            for (auto &line : lines) {
+              line.offset += base;
+            }
+            return parse_batch(self, lines, number_of_threads, Output::MORPHEME, Filter{}, counters, Unit::BYTE);
+          },
+          py::arg("buffer"), py::arg("number_of_threads") = 1, py::arg("offset") = py::none(),
+          py::arg("counters") = nullptr)
+      // Returns a list of `mecab.Morpheme` in a document, which is analyzed in pieces of at most `max_length` characters
+      .def(
+          "parse_document",
+          [](const MeCab::Tagger &self, const std::string &document, size_t number_of_threads, size_t max_length,
+             Counters *counters) {
+            std::vector<Token> tokens;
+            {
+              py::gil_scoped_release release;
+              std::vector<Piece> pieces = split_document(document.c_str(), document.size(), max_length);
+              std::vector<Sentence> sentences;
+              sentences.reserve(pieces.size());
+              for (const auto &piece : pieces) {
+                sentences.push_back(piece.sentence);
+              }
+
+              std::vector<Result> results = analyze_batch(self, sentences, number_of_threads, Filter{});
+              for (const auto &result : results) {
+                if (!result.succeeded) {
+                  throw std::runtime_error(result.what);
+                }
+              }
+              tokens = stitch(document.c_str(), pieces, results);
+              if (counters != nullptr) {
+                count(sentences, results, *counters);
+              }
+            }
+            return to_outputs(Output::MORPHEME, document.c_str(), tokens);
+          },
+          py::arg("document"), py::arg("number_of_threads") = 1, py::arg("max_length") = 1000,
+          py::arg("counters") = nullptr)
+      // Returns `(sentence_offsets, starts, ends, pos_ids, pos_tags, surface_offsets, surfaces)`
+      .def(
+          "parse_columnar",
+          [](const MeCab::Tagger &self, const std::vector<std::string> &sentences, size_t number_of_threads,
+             const std::vector<std::string> &include_pos, Counters *counters,
+             const std::vector<std::string> &exclude_pos) {
+            Columns columns;
+            {
+              py::gil_scoped_release release;
+              std::vector<Sentence> views = to_sentences(sentences);
+              std::vector<Result> results =
+                  analyze_batch(self, views, number_of_threads, Filter{include_pos, exclude_pos});
+              for (const auto &result : results) {
+                if (!result.succeeded) {
+                  throw std::runtime_error(result.what);
+                }
+              }
+              columns = to_columns(views, results);
+              if (counters != nullptr) {
+                count(views, results, *counters);
+              }
+            }
+            return to_tuple(std::move(columns));
+          },
+          py::arg("sentences"), py::arg("number_of_threads") = 1, py::arg("include_pos") = std::vector<std::string>{},
+          py::arg("counters") = nullptr, py::arg("exclude_pos") = std::vector<std::string>{})
       .def("set_theta", &MeCab::Tagger::set_theta)
       .def("theta", &MeCab::Tagger::theta)
       .def("dictionary_info", &MeCab::Tagger::dictionary_info, py::return_value_policy::reference)
       .def("what", &MeCab::Tagger::what, py::return_value_policy::copy)
       .def_static("version", &MeCab::Tagger::version);
-}
\ No newline at end of file
+}
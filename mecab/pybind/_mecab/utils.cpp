@@ -9,6 +9,11 @@ size_t utf8_strlen(const char *begin, const char *end) {
   return length;
 }
 
+// Whitespace skipped by MeCab before each morpheme
+bool is_space(char c) {
+  return (c == ' ') || (c == '\t') || (c == '\n') || (c == '\v') || (c == '\r');
+}
+
 std::vector<char *> to_argv(const std::vector<std::string> &arguments) {
   std::vector<char *> argv{const_cast<char *>("")}; // argv[0] is excutable name
   for (const auto &argument : arguments) {
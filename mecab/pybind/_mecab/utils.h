@@ -8,5 +8,6 @@
 #include <pybind11/stl.h>
 
 size_t utf8_strlen(const char *begin, const char *end);
+bool is_space(char c);
 std::vector<char *> to_argv(const std::vector<std::string> &arguments);
 std::string escape(const std::string &text);
\ No newline at end of file
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import _mecab
+
+
+class PosRegistry:
+    """A process-wide registry assigning an integer id to each part-of-speech tag.
+
+    `pos_ids` of `Columns` and `LatticeGraph` are ids in the registry, so they can be compared across results.
+    Tags of mecab-ko-dic have the same ids in every process, and other tags (e.g. `VV+EC`) are registered
+    as they appear.
+    """
+
+    def id(self, tag: str) -> int:
+        """Returns the id of a given part-of-speech tag, registering it if it is not registered yet."""
+        return _mecab.pos_id(tag)
+
+    def tag(self, id: int) -> str:
+        """Returns the part-of-speech tag of a given id.
+
+        Raises:
+            IndexError: If the id is not registered
+        """
+        return _mecab.pos_tags()[id]
+
+    def tags(self) -> list[str]:
+        """Returns the registered part-of-speech tags, indexed by their ids."""
+        return _mecab.pos_tags()
+
+    def __len__(self) -> int:
+        return len(_mecab.pos_tags())
+
+
+pos_registry = PosRegistry()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from enum import Enum
 from pathlib import Path
-from typing import NamedTuple, Optional
+from typing import NamedTuple, Optional, Union
 
 import _mecab
 
@@ -94,6 +94,127 @@ class Morpheme(NamedTuple):
         return cls(surface=node.surface, feature=Feature._from_feature(node.feature), span=Span(*span))
 
 
+class Constraint(NamedTuple):
+    """Represents a span of a sentence to be analyzed as a single morpheme
+
+    Attributes:
+        start: A start index of the span
+        end: An end index of the span
+        feature: A feature of the morpheme, or its leading fields such as `"NNP"`. `*` matches any value of a field.
+            If not provided, any feature is allowed.
+    """
+
+    start: int
+    end: int
+    feature: Optional[Union[str, Feature]] = None
+
+    def _to_pattern(self) -> str:
+        if self.feature is None:
+            return "*"
+
+        # Unspecified fields match any value, and also fill the feature of a morpheme not found in the dictionaries
+        values = str(self.feature).split(",")
+        return ",".join(values + ["*"] * (len(Feature._fields) - len(values)))
+
+    @classmethod
+    def _to_native(cls, constraints: list[Union[Constraint, tuple]]) -> list[tuple[int, int, str]]:
+        constraints = [cls(*constraint) for constraint in constraints]
+        return [(constraint.start, constraint.end, constraint._to_pattern()) for constraint in constraints]
+
+
+class Candidate(NamedTuple):
+    """Represents a candidate of morpheme analysis
+
+    Attributes:
+        morphemes: Morphemes in the path of the candidate
+        cost: A total cost of the path. A candidate with a lower cost is more likely.
+    """
+
+    morphemes: list[Morpheme]
+    cost: int
+
+
+class Columns(NamedTuple):
+    """Represents morphemes of multiple sentences as contiguous arrays.
+
+    Every array supports the buffer protocol, so it can be consumed without copying
+    (e.g. `numpy.frombuffer()` or `pyarrow.py_buffer()`).
+    The morphemes of the `i`-th sentence are in `sentence_offsets[i]:sentence_offsets[i + 1]` of each per-morpheme array.
+
+    Attributes:
+        sentence_offsets: An index of the first morpheme of each sentence, followed by the total number of morphemes
+        starts: A start index of each morpheme in its sentence
+        ends: An end index of each morpheme in its sentence
+        pos_ids: An id of the part-of-speech tag of each morpheme in `pos_registry`, which indexes `pos_tags`
+        pos_tags: Part-of-speech tags registered in `pos_registry`, indexed by their ids
+        surface_offsets: A byte offset of each surface in `surfaces`, followed by the length of `surfaces`
+        surfaces: UTF-8 encoded surfaces of the morphemes
+    """
+
+    sentence_offsets: memoryview
+    starts: memoryview
+    ends: memoryview
+    pos_ids: memoryview
+    pos_tags: list[str]
+    surface_offsets: memoryview
+    surfaces: memoryview
+
+    def surface(self, index: int) -> str:
+        """Returns the surface of the `index`-th morpheme"""
+        return bytes(self.surfaces[self.surface_offsets[index] : self.surface_offsets[index + 1]]).decode("utf-8")
+
+    def pos(self, index: int) -> str:
+        """Returns the part-of-speech tag of the `index`-th morpheme"""
+        return self.pos_tags[self.pos_ids[index]]
+
+    @classmethod
+    def _from_columns(cls, columns: tuple) -> Columns:
+        return cls(*(column if isinstance(column, list) else memoryview(column) for column in columns))
+
+
+class LatticeGraph(NamedTuple):
+    """Represents every candidate morpheme of a sentence and paths between them as contiguous arrays.
+
+    Every array supports the buffer protocol, as in `Columns`.
+    Nodes are ordered by their start indexes. The first node is BOS, and the last node is EOS.
+
+    Attributes:
+        starts: A start index of each node in the sentence
+        ends: An end index of each node in the sentence
+        pos_ids: An id of the part-of-speech tag of each node in `pos_registry`, which indexes `pos_tags`
+        pos_tags: Part-of-speech tags registered in `pos_registry`, indexed by their ids
+        stats: A type of each node (`0`: known, `1`: unknown, `2`: BOS, `3`: EOS)
+        best: Whether each node is in the best path (`1`) or not (`0`)
+        word_costs: A cost of each word
+        costs: A cost of the best path from BOS to each node
+        probabilities: A marginal probability of each node
+        path_lefts: An index of the left node of each path
+        path_rights: An index of the right node of each path
+        path_costs: A cost of each path, which is the connection cost plus the word cost of the right node
+    """
+
+    starts: memoryview
+    ends: memoryview
+    pos_ids: memoryview
+    pos_tags: list[str]
+    stats: memoryview
+    best: memoryview
+    word_costs: memoryview
+    costs: memoryview
+    probabilities: memoryview
+    path_lefts: memoryview
+    path_rights: memoryview
+    path_costs: memoryview
+
+    def pos(self, index: int) -> str:
+        """Returns the part-of-speech tag of the `index`-th node"""
+        return self.pos_tags[self.pos_ids[index]]
+
+    @classmethod
+    def _from_graph(cls, graph: tuple) -> LatticeGraph:
+        return cls(*(array if isinstance(array, list) else memoryview(array) for array in graph))
+
+
 class Dictionary(NamedTuple):
     """Represents a dictionary information
 
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import csv
+import os
+import re
+import struct
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import mecab_ko_dic
+
+import _mecab
+from mecab.mecab import MeCabError, PathLike
+from mecab.types import Feature
+
+# Reference: https://github.com/taku910/mecab/blob/master/mecab/src/dictionary.cpp
+_header = struct.Struct("<10I32s")  # magic, version, type, lexsize, lsize, rsize, dsize, tsize, fsize, dummy, charset
+_token = struct.Struct("<HHHhII")  # lcAttr, rcAttr, posid, wcost, feature, compound
+
+_invalid_pattern = re.compile("[\t\r\n\0]")
+_quoted_pattern = re.compile('^ |[,"]')
+_reference_pattern = re.compile(r"\$(\d+)")
+
+# Costs are stored as signed 16-bit integers
+_min_cost, _max_cost = -32768, 32767
+
+
+def _to_key(entry: tuple) -> tuple[str, str, Optional[int]]:
+    surface, feature, cost = (*entry, None) if len(entry) == 2 else entry
+    feature = str(feature)
+    if _invalid_pattern.search(surface) or _invalid_pattern.search(feature):
+        raise ValueError(f"invalid character in an entry: {surface!r}")
+    if not surface:
+        raise ValueError("surface must not be empty")
+    if (cost is not None) and not (_min_cost <= cost <= _max_cost):
+        raise ValueError(f"cost must be between {_min_cost} and {_max_cost}: {surface!r}")
+
+    return surface, feature, cost
+
+
+def _split(value: str) -> list[str]:
+    return next(csv.reader([value]))
+
+
+def _match(pattern: str, value: str) -> bool:
+    if pattern.startswith("*") or (pattern == value):
+        return True
+    if (len(pattern) >= 3) and pattern.startswith("(") and pattern.endswith(")"):
+        return value in pattern[1:-1].split("|")
+    return False
+
+
+def _rewrite(rules: list[tuple[list[str], list[str]]], fields: list[str]) -> Optional[str]:
+    for pattern, target in rules:
+        if (len(pattern) <= len(fields)) and all(_match(*pair) for pair in zip(pattern, fields)):
+            values = [_reference_pattern.sub(lambda match: fields[int(match.group(1)) - 1], value) for value in target]
+            return ",".join(_quote_field(value) for value in values)
+    return None
+
+
+def _quote_field(value: str) -> str:
+    if ("," in value) or ('"' in value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+class _FeatureChecker:
+    # MeCab aborts the process on features it cannot resolve into context IDs, so they are checked in advance
+    # in the same way as MeCab resolves them
+    # Reference: https://github.com/taku910/mecab/blob/master/mecab/src/dictionary_rewriter.cpp
+
+    def __init__(self, dictionary_path: Path):
+        self._rules: dict[str, list[tuple[list[str], list[str]]]] = {"left": [], "right": []}
+        with open(dictionary_path / "rewrite.def", encoding="utf-8") as input_file:
+            section = None
+            for line in input_file:
+                line = line.rstrip("\r\n")
+                if (not line) or line.startswith("#"):
+                    continue
+                if line.startswith("["):
+                    section = line[1:].split()[0]
+                elif section in self._rules:
+                    pattern, target = line.split(maxsplit=1)
+                    self._rules[section].append((_split(pattern), _split(" ".join(target.split()))))
+
+        self._features: dict[str, set[str]] = {}
+        for context in self._rules:
+            with open(dictionary_path / f"{context}-id.def", encoding="utf-8") as input_file:
+                self._features[context] = {line.rstrip("\r\n").split(maxsplit=1)[1] for line in input_file}
+
+    def check(self, feature: str):
+        fields = _split(feature)
+        for context, rules in self._rules.items():
+            try:
+                resolved = _rewrite(rules, fields)
+            except IndexError:
+                resolved = None
+
+            if resolved is None:
+                raise ValueError(f"feature does not have the fields of the system dictionary: {feature!r}")
+            if resolved not in self._features[context]:
+                raise ValueError(f"unknown part-of-speech in a feature: {feature!r}")
+
+
+def _quote(surface: str) -> str:
+    if _quoted_pattern.search(surface):
+        return '"' + surface.replace('"', '""') + '"'
+    return surface
+
+
+def _read_values(path: Path, size: int) -> Optional[list[tuple[int, int, int]]]:
+    # Context IDs and costs of entries, which are resolved by MeCab if not given
+    data = path.read_bytes()
+    _, _, _, lexsize, _, _, dsize, tsize, fsize, _, _ = _header.unpack_from(data)
+    if lexsize != size:
+        return None
+
+    tokens_offset = _header.size + dsize
+    features_offset = tokens_offset + tsize
+
+    # Features are stored in the order of entries, and each token refers to the offset of its feature
+    indexes = {}
+    offset = 0
+    for index, feature in enumerate(data[features_offset : features_offset + fsize].split(b"\0")[:size]):
+        indexes[offset] = index
+        offset += len(feature) + 1
+
+    values = [None] * size
+    tokens = data[tokens_offset : tokens_offset + lexsize * _token.size]
+    for lid, rid, _, cost, feature, _ in _token.iter_unpack(tokens):
+        values[indexes[feature]] = (lid, rid, cost)
+    return values
+
+
+def _load_entries(path: Path, identity: str) -> tuple[list[tuple], dict[tuple, tuple[int, int, int]]]:
+    keys = []
+    values = {}
+    if not path.exists():
+        return keys, values
+
+    with open(path, encoding="utf-8") as input_file:
+        if input_file.readline().rstrip("\n") != identity:
+            return keys, values
+
+        for line in input_file:
+            surface, feature, cost, lid, rid, resolved_cost = line.rstrip("\n").split("\t")
+            key = (surface, feature, int(cost) if cost else None)
+            keys.append(key)
+            values[key] = (int(lid), int(rid), int(resolved_cost))
+    return keys, values
+
+
+def _save_entries(path: Path, identity: str, keys: list[tuple], values: list[tuple[int, int, int]]):
+    with open(path, "w", encoding="utf-8", newline="\n") as output_file:
+        output_file.write(f"{identity}\n")
+        output_file.writelines(
+            f"{surface}\t{feature}\t{cost if cost is not None else ''}\t{lid}\t{rid}\t{resolved_cost}\n"
+            for (surface, feature, cost), (lid, rid, resolved_cost) in zip(keys, values)
+        )
+
+
+def build_user_dictionary(
+    entries: Iterable[Union[tuple[str, Union[str, Feature]], tuple[str, Union[str, Feature], Optional[int]]]],
+    output_path: PathLike,
+    dictionary_path: Optional[PathLike] = None,
+) -> Path:
+    """Compile a user dictionary from given entries in the current process.
+
+    Context IDs and costs which MeCab resolved for entries are kept next to the user dictionary.
+    When the user dictionary is built again, they are reused for unchanged entries, so that only new or changed entries
+    are resolved by MeCab. If no entries changed, the user dictionary is not compiled again.
+
+    Parameters:
+        entries: An iterable of `(surface, feature, cost)` tuples. `feature` is a `Feature` or its string form.
+            If `cost` is omitted or `None`, it is estimated from the model of the system dictionary.
+        output_path: Path to the user dictionary to build
+        dictionary_path: Path to the system dictionary to build with.
+            If not provided, the default mecab-ko-dic dictionary will be used.
+
+    Returns:
+        The path to the user dictionary
+
+    Raises:
+        ValueError: If an entry is invalid, e.g. its feature is not resolved by the system dictionary
+            or its cost is out of the range of signed 16-bit integers
+    """
+    output_path = Path(output_path).absolute()
+    if dictionary_path is None:
+        dictionary_path, model_path = Path(mecab_ko_dic.dictionary_path), Path(mecab_ko_dic.model_path)
+    else:
+        dictionary_path = Path(dictionary_path)
+        model_path = dictionary_path / "model.bin" if (dictionary_path / "model.bin").exists() else None
+    options = ["--dicdir", str(dictionary_path)]
+    if model_path is not None:
+        options += ["--model", str(model_path)]
+
+    # Entries whose costs are estimated come first, as MeCab does not load the model for later ones
+    keys = sorted((_to_key(entry) for entry in entries), key=lambda key: key[2] is not None)
+    if not keys:
+        raise ValueError("entries must not be empty")
+
+    entries_path = output_path.with_name(output_path.name + ".entries")
+    identity = " ".join(options)
+    previous_keys, resolved = _load_entries(entries_path, identity) if output_path.exists() else ([], {})
+    if previous_keys == keys:
+        return output_path
+
+    unresolved = [key for key in keys if key not in resolved]
+    if (model_path is None) and any(cost is None for _, _, cost in unresolved):
+        raise ValueError(f"costs must be given, as no model is found in the dictionary: {dictionary_path}")
+    checker = _FeatureChecker(dictionary_path)
+    for feature in {feature for _, feature, _ in unresolved}:
+        checker.check(feature)
+
+    with tempfile.TemporaryDirectory(dir=output_path.parent) as directory:
+        csv_path = Path(directory) / "user.csv"
+        with open(csv_path, "w", encoding="utf-8", newline="\n") as output_file:
+            for key in keys:
+                surface, feature, cost = key
+                lid, rid, cost = resolved.get(key, ("", "", cost if cost is not None else ""))
+                output_file.write(f"{_quote(surface)},{lid},{rid},{cost},{feature}\n")
+
+        temporary_path = Path(directory) / "user.dic"
+        if _mecab.cli.dict_index([*options, "--userdic", str(temporary_path), str(csv_path)]) != 0:
+            raise MeCabError(f"failed to build a user dictionary: {output_path}")
+
+        values = _read_values(temporary_path, len(keys))
+        os.replace(temporary_path, output_path)
+
+    if values is not None:
+        _save_entries(entries_path, identity, keys, values)
+    elif entries_path.exists():
+        entries_path.unlink()
+    return output_path
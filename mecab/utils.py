@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any
+import mmap
+from collections import deque
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Union
 
 import _mecab
 
@@ -13,6 +16,120 @@ def create_lattice(sentence: str) -> _mecab.Lattice:
     return lattice
 
 
+class LatticePool:
+    """A bounded pool of lattices which are cleared and reused across parses.
+
+    A lattice keeps its internal buffers as large as the longest sentence it has analyzed,
+    so lattices used for a sentence longer than `max_sentence_length` are discarded instead of being reused.
+    """
+
+    def __init__(self, max_size: int = 16, max_sentence_length: int = 8192):
+        self._max_size = max_size
+        self._max_sentence_length = max_sentence_length
+        self._lattices: deque[_mecab.Lattice] = deque()
+
+    def acquire(
+        self,
+        sentence: str,
+        request_type: int = _mecab.MECAB_ONE_BEST,
+        theta: Optional[float] = None,
+        constraints: Optional[list[tuple[int, int, str]]] = None,
+    ) -> _mecab.Lattice:
+        """Returns a lattice holding a given sentence, with a given request type, temperature and constraints.
+
+        The lattice refers to `sentence` and features of `constraints` without copying them,
+        so they must be kept alive until the lattice is released.
+        """
+        try:
+            lattice = self._lattices.pop()
+        except IndexError:
+            lattice = _mecab.Lattice()
+
+        lattice.set_request_type(request_type)
+        lattice.set_sentence(sentence)
+        # Must be set after the sentence, which resets the lattice
+        if theta is not None:
+            lattice.set_theta(theta)
+        if constraints:
+            lattice.set_constraints(constraints)
+        return lattice
+
+    def release(self, lattice: _mecab.Lattice, sentence: str):
+        """Clears a lattice acquired by `acquire()`, and returns it to the pool."""
+        lattice.clear()
+        if (len(sentence) <= self._max_sentence_length) and (len(self._lattices) < self._max_size):
+            self._lattices.append(lattice)
+
+    def __len__(self) -> int:
+        return len(self._lattices)
+
+
+def read_chunks(file: BinaryIO, chunk_size: int) -> Iterator[tuple[int, memoryview]]:
+    """Reads a binary file in chunks ending at line boundaries.
+
+    Returns:
+        An iterator of `(offset of the chunk in the file, chunk)` pairs.
+    """
+    offset = 0
+    remainder = b""
+    while True:
+        block = file.read(chunk_size)
+        if not block:
+            if remainder:
+                yield offset, memoryview(remainder)
+            return
+
+        block = remainder + block
+        end = block.rfind(b"\n") + 1
+        if end == 0:  # No line boundary yet
+            remainder = block
+            continue
+
+        yield offset, memoryview(block)[:end]
+        offset += end
+        remainder = block[end:]
+
+
+def map_chunks(path: Union[str, Path], chunk_size: int) -> Iterator[tuple[int, memoryview]]:
+    """Maps a file into memory, and splits it into chunks ending at line boundaries without copying.
+
+    Returns:
+        An iterator of `(offset of the chunk in the file, chunk)` pairs.
+    """
+    with open(path, "rb") as file:
+        if Path(path).stat().st_size == 0:  # An empty file cannot be mapped
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            size = len(mapped_file)
+            start = 0
+            while start < size:
+                end = mapped_file.find(b"\n", min(start + chunk_size, size) - 1)
+                end = size if end == -1 else end + 1
+
+                with memoryview(mapped_file)[start:end] as chunk:
+                    yield start, chunk
+                start = end
+
+
+def batch_lines(lines: Iterable[str], chunk_size: int) -> Iterator[list[str]]:
+    """Groups lines into batches of at least `chunk_size` characters, stripping line breaks."""
+    lines = iter(lines)
+    while True:
+        batch = []
+        length = 0
+        for line in lines:
+            line = line.rstrip("\r\n")
+            batch.append(line)
+            length += len(line) + 1
+            if length >= chunk_size:
+                break
+
+        if not batch:
+            return
+        yield batch
+
+
 def ensure_list(value: Any) -> list[Any]:
     if value is None:
         return []
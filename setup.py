@@ -48,6 +48,8 @@ class unix_build_ext(build_ext):
             extension.include_dirs.append(mecab_config("--inc-dir"))
             extension.library_dirs.append(mecab_config("--libs-only-L"))
             extension.libraries.append("mecab")
+            extension.extra_compile_args.append("-pthread")
+            extension.extra_link_args.append("-pthread")
 
         super().build_extension(extension)
 
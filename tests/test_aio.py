@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from mecab import AsyncMeCab, MeCab
+
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
+
+
+def readlines(path: Path) -> list[str]:
+    lines = path.read_text(encoding="utf-8").strip()
+    return lines.splitlines()
+
+
+def test_async_mecab(mecab: MeCab):
+    async def main():
+        async with AsyncMeCab() as async_mecab:
+            sentence = "나의 꿈은 맑은 바람이 되어서"
+            assert await async_mecab.parse(sentence) == mecab.parse(sentence)
+            assert await async_mecab.pos(sentence) == mecab.pos(sentence)
+            assert await async_mecab.morphs(sentence) == mecab.morphs(sentence)
+            assert await async_mecab.nouns(sentence) == mecab.nouns(sentence)
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("max_batch_size,max_pending", [(1, 1), (16, 32), (64, 1024)])
+def test_async_mecab_concurrency(mecab: MeCab, max_batch_size: int, max_pending: int):
+    lines = readlines(corpus_path)
+
+    async def main():
+        async with AsyncMeCab(max_batch_size=max_batch_size, max_pending=max_pending) as async_mecab:
+            assert await async_mecab.parse_batch(lines) == mecab.parse_batch(lines)
+            assert await asyncio.gather(*(async_mecab.morphs(line) for line in lines)) == mecab.morphs_batch(lines)
+
+    asyncio.run(main())
+
+
+def test_async_mecab_cancellation(mecab: MeCab):
+    async def main():
+        async with AsyncMeCab() as async_mecab:
+            cancelled = asyncio.ensure_future(async_mecab.pos("나의 꿈"))
+            completed = asyncio.ensure_future(async_mecab.pos("맑은 바람"))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+
+            assert await completed == mecab.pos("맑은 바람")
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+
+    asyncio.run(main())
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mecab import MeCab
+
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
+
+
+def readlines(path: Path) -> list[str]:
+    lines = path.read_text(encoding="utf-8").strip()
+    return lines.splitlines()
+
+
+def test_parse_batch(mecab: MeCab):
+    assert mecab.parse_batch([]) == []
+
+    sentences = ["", "나의 꿈은 맑은 바람이 되어서", "흙에서 자란 내 마음 파아란 하늘빛"]
+    assert mecab.parse_batch(sentences) == [mecab.parse(sentence) for sentence in sentences]
+
+
+@pytest.mark.parametrize("number_of_threads", [1, 2, 8])
+def test_parse_batch_corpus(mecab: MeCab, number_of_threads: int):
+    lines = readlines(corpus_path)
+    assert mecab.parse_batch(lines, number_of_threads=number_of_threads) == [mecab.parse(line) for line in lines]
+
+
+def test_pos_batch(mecab: MeCab):
+    sentences = ["", "나의 꿈은 맑은 바람이 되어서"]
+    assert mecab.pos_batch(sentences) == [mecab.pos(sentence) for sentence in sentences]
+
+
+def test_morphs_batch(mecab: MeCab):
+    sentences = ["", "나의 꿈은 맑은 바람이 되어서"]
+    assert mecab.morphs_batch(sentences) == [mecab.morphs(sentence) for sentence in sentences]
+
+
+def test_nouns_batch(mecab: MeCab):
+    sentences = ["", "나의 꿈은 맑은 바람이 되어서"]
+    assert mecab.nouns_batch(sentences) == [mecab.nouns(sentence) for sentence in sentences]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mecab import Feature, MeCab, build_user_dictionary
+
+
+def test_build_user_dictionary(tmp_path: Path):
+    dictionary_path = build_user_dictionary(
+        [
+            ("트위치", Feature(pos="NNP", has_jongseong=False)),
+            ("플랫폼", "NNG,*,T,플랫폼,*,*,*,*", 0),
+            ('a,"b', Feature(pos="SL"), 100),
+        ],
+        tmp_path / "user.dic",
+    )
+
+    mecab = MeCab(user_dictionary_path=dictionary_path)
+    assert len(mecab.dictionary) == 2
+    assert mecab.pos("트위치는 양방향 생방송 플랫폼입니다") == [
+        ("트위치", "NNP"),
+        ("는", "JX"),
+        ("양방향", "NNG"),
+        ("생방송", "NNG"),
+        ("플랫폼", "NNG"),
+        ("입니다", "VCP+EC"),
+    ]
+    assert mecab.morphs('a,"b') == ['a,"b']
+
+
+def test_build_user_dictionary_incremental(tmp_path: Path):
+    output_path = tmp_path / "user.dic"
+    entries = [("트위치", Feature(pos="NNP", has_jongseong=False))]
+
+    build_user_dictionary(entries, output_path)
+    modified_at = output_path.stat().st_mtime_ns
+
+    # Unchanged entries are not compiled again
+    build_user_dictionary(entries, output_path)
+    assert output_path.stat().st_mtime_ns == modified_at
+
+    # Resolved context IDs and costs are reused for unchanged entries
+    entries.append(("플랫폼", Feature(pos="NNG", has_jongseong=True)))
+    build_user_dictionary(entries, output_path)
+    build_user_dictionary(entries, tmp_path / "expected.dic")
+    assert output_path.read_bytes() == (tmp_path / "expected.dic").read_bytes()
+
+    assert MeCab(user_dictionary_path=output_path).morphs("트위치 플랫폼") == ["트위치", "플랫폼"]
+
+
+def test_build_user_dictionary_estimated_cost(tmp_path: Path):
+    # An entry whose cost is estimated after an entry whose cost is given
+    dictionary_path = build_user_dictionary(
+        [("하", "NNP,*,F,하,*,*,*,*", 100), ("쀍", "NNP,*,T,쀍,*,*,*,*", None)], tmp_path / "user.dic"
+    )
+    assert MeCab(user_dictionary_path=dictionary_path).pos("쀍") == [("쀍", "NNP")]
+
+
+@pytest.mark.parametrize(
+    "entries",
+    [
+        [],
+        [("", "NNG")],
+        [("트위\n치", "NNP")],
+        [("하", "NNP")],
+        [("하", "XYZ,*,F,하,*,*,*,*")],
+        [("하", "NNP,*,F,하,*,*,*,*", 99999)],
+        [("하", "NNP,*,F,하,*,*,*,*", -32769)],
+    ],
+)
+def test_build_user_dictionary_invalid(tmp_path: Path, entries: list[tuple]):
+    with pytest.raises(ValueError):
+        build_user_dictionary(entries, tmp_path / "user.dic")
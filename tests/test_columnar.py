@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from mecab import MeCab
+
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
+
+
+def readlines(path: Path) -> list[str]:
+    lines = path.read_text(encoding="utf-8").strip()
+    return lines.splitlines()
+
+
+def test_parse_columnar(mecab: MeCab):
+    columns = mecab.parse_columnar([])
+    assert columns.sentence_offsets.tolist() == [0]
+    assert columns.surface_offsets.tolist() == [0]
+    assert len(columns.starts) == len(columns.ends) == len(columns.pos_ids) == len(columns.surfaces) == 0
+
+    columns = mecab.parse_columnar(["나의 꿈은", "", "하늘빛!"])
+    assert columns.sentence_offsets.tolist() == [0, 4, 4, 6]
+    assert columns.starts.tolist() == [0, 1, 3, 4, 0, 3]
+    assert columns.ends.tolist() == [1, 2, 4, 5, 3, 4]
+    assert [columns.pos(index) for index in range(6)] == ["NP", "JKG", "NNG", "JX", "NNG", "SF"]
+    assert [columns.surface(index) for index in range(6)] == ["나", "의", "꿈", "은", "하늘빛", "!"]
+    assert bytes(columns.surfaces).decode("utf-8") == "나의꿈은하늘빛!"
+
+
+def test_parse_columnar_corpus(mecab: MeCab):
+    lines = readlines(corpus_path)
+    columns = mecab.parse_columnar(lines, number_of_threads=4)
+
+    for index, morphemes in enumerate(mecab.parse_batch(lines)):
+        start, end = columns.sentence_offsets[index], columns.sentence_offsets[index + 1]
+        assert [
+            ((columns.starts[position], columns.ends[position]), columns.surface(position), columns.pos(position))
+            for position in range(start, end)
+        ] == [(tuple(morpheme.span), morpheme.surface, morpheme.pos) for morpheme in morphemes]
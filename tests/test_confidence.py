@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pytest
+
+from mecab import MeCab
+
+sentence = "아버지가방에들어가신다"
+
+
+def test_parse_with_confidence(mecab: MeCab):
+    results = mecab.parse(sentence, with_confidence=True)
+    assert [morpheme for morpheme, _ in results] == mecab.parse(sentence)
+    assert all(0.0 <= probability <= 1.0 + 1e-6 for _, probability in results)
+
+
+def test_parse_with_confidence_theta(mecab: MeCab):
+    sharp = [probability for _, probability in mecab.parse(sentence, with_confidence=True)]
+    smooth = [probability for _, probability in mecab.parse(sentence, with_confidence=True, theta=0.001)]
+    assert min(smooth) < min(sharp)
+
+    # Neither the request type nor the temperature is kept in pooled lattices
+    assert [probability for _, probability in mecab.parse(sentence, with_confidence=True)] == sharp
+
+
+def test_parse_batch_with_confidence(mecab: MeCab):
+    sentences = [sentence, "나의 꿈은 맑은 바람이 되어서"]
+
+    results = mecab.parse_batch(sentences, number_of_threads=2, with_confidence=True, theta=0.001)
+    for result, text in zip(results, sentences):
+        expected = mecab.parse(text, with_confidence=True, theta=0.001)
+        assert [morpheme for morpheme, _ in result] == [morpheme for morpheme, _ in expected]
+        assert [probability for _, probability in result] == pytest.approx([probability for _, probability in expected])
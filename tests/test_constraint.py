@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+
+from mecab import Constraint, MeCab
+
+
+def test_parse_constraint(mecab: MeCab):
+    sentence = "신제품 ABC-123X는 https://example.com/?q=1 에서 구매"
+    url = "https://example.com/?q=1"
+    start = sentence.index(url)
+
+    morphemes = mecab.parse(sentence, constraints=[Constraint(4, 12, "NNP"), (start, start + len(url), "SL")])
+    assert [(morpheme.surface, morpheme.pos) for morpheme in morphemes][2:5] == [
+        ("ABC-123X", "NNP"),
+        ("는", "JX"),
+        (url, "SL"),
+    ]
+
+    for morpheme in morphemes:
+        assert sentence[morpheme.span.start : morpheme.span.end] == morpheme.surface
+
+
+def test_parse_constraint_feature(mecab: MeCab):
+    sentence = "아버지가방에들어가신다"
+
+    morphemes = mecab.parse(sentence, constraints=[(3, 5, "NNG")])
+    assert [morpheme.surface for morpheme in morphemes] == ["아버지", "가방", "에", "들어가", "신다"]
+
+    # A feature not found in the dictionaries
+    morphemes = mecab.parse(sentence, constraints=[(0, 3, "NNP")])
+    assert (morphemes[0].surface, morphemes[0].pos) == ("아버지", "NNP")
+
+
+def test_parse_constraint_pool(mecab: MeCab):
+    sentence = "아버지가방에들어가신다"
+    expected = mecab.parse(sentence)
+
+    mecab.parse(sentence, constraints=[(3, 5, "NNG")])
+    assert mecab.parse(sentence) == expected
+
+
+def test_parse_batch_constraint(mecab: MeCab):
+    sentences = ["아버지가방에들어가신다", "신제품 ABC-123X는 품절"]
+    constraints = [[(3, 5, "NNG")], [(4, 12, "NNP")]]
+
+    expected = [
+        mecab.parse(sentence, constraints=constraints_) for sentence, constraints_ in zip(sentences, constraints)
+    ]
+    assert mecab.parse_batch(sentences, constraints=constraints) == expected
+    assert mecab.parse_batch(sentences, number_of_threads=2, constraints=constraints) == expected
+
+    with pytest.raises(ValueError):
+        mecab.parse_batch(sentences, constraints=constraints[:1])
+
+
+@pytest.mark.parametrize("constraints", [[(3, 3)], [(0, 4), (2, 6)], [(0, 100)]])
+def test_parse_constraint_invalid(mecab: MeCab, constraints: list[tuple[int, int]]):
+    with pytest.raises(ValueError):
+        mecab.parse("아버지가방에들어가신다", constraints=constraints)
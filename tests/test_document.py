@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mecab import MeCab
+
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
+
+
+def readlines(path: Path) -> list[str]:
+    lines = path.read_text(encoding="utf-8").strip()
+    return lines.splitlines()
+
+
+def test_parse_document(mecab: MeCab):
+    assert mecab.parse_document("") == []
+
+    document = ' 안녕하세요.  반갑습니다! "정말요?" 네…\n\n그래요'
+    morphemes = mecab.parse_document(document)
+    for morpheme in morphemes:
+        assert document[morpheme.span.start : morpheme.span.end] == morpheme.surface
+
+    expected = []
+    for sentence in ["안녕하세요.", "반갑습니다!", '"정말요?"', "네…", "그래요"]:
+        offset = document.index(sentence)
+        expected += [(morpheme.span.start + offset, morpheme.surface) for morpheme in mecab.parse(sentence)]
+    assert [(morpheme.span.start, morpheme.surface) for morpheme in morphemes] == expected
+
+
+def test_parse_document_corpus(mecab: MeCab):
+    document = "\n".join(readlines(corpus_path))
+
+    morphemes = mecab.parse_document(document)
+    for morpheme in morphemes:
+        assert document[morpheme.span.start : morpheme.span.end] == morpheme.surface
+
+    assert mecab.parse_document(document, number_of_threads=4) == morphemes
+
+
+@pytest.mark.parametrize("max_length", [50, 200])
+def test_parse_document_window(mecab: MeCab, max_length: int):
+    # A single long sentence, which is split into windows
+    sentence = " ".join(line.rstrip(".") for line in readlines(corpus_path)[:20])
+
+    assert mecab.parse_document(sentence, max_length=max_length, number_of_threads=2) == mecab.parse(sentence)
+
+
+def test_parse_document_without_whitespace(mecab: MeCab):
+    sentence = "아버지가방에들어가신다" * 30
+
+    morphemes = mecab.parse_document(sentence, max_length=50)
+    assert "".join(morpheme.surface for morpheme in morphemes) == sentence
+    for morpheme in morphemes:
+        assert sentence[morpheme.span.start : morpheme.span.end] == morpheme.surface
+
+
+def test_parse_document_invalid(mecab: MeCab):
+    with pytest.raises(ValueError):
+        mecab.parse_document("하늘빛", max_length=0)
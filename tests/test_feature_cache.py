@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from mecab import MeCab, feature_cache
+
+
+def test_feature_cache(mecab: MeCab):
+    feature_cache.clear()
+
+    first = mecab.parse("나의 꿈")
+    second = mecab.parse_batch(["나의 꿈"])[0]
+    assert first == second
+    assert all(a.feature is b.feature for a, b in zip(first, second))
+    assert mecab.pos("나의 꿈")[0][1] is mecab.pos_batch(["나의 꿈"])[0][0][1]
+
+    info = feature_cache.info()
+    assert info.entries == len(feature_cache) == 3
+    assert info.hits > 0
+    assert info.bytes > 0
+
+
+def test_feature_cache_constraints(mecab: MeCab):
+    feature_cache.clear()
+
+    morphemes = mecab.parse("하늘빛은", constraints=[(0, 3, "NNP,*,F,하늘빛,*,*,*,*")])
+    assert morphemes[0].feature.reading == "하늘빛"
+    # Features given by constraints are not interned
+    assert len(feature_cache) == 1
+
+
+def test_feature_cache_resize(mecab: MeCab):
+    try:
+        feature_cache.resize(0)
+        assert len(feature_cache) == 0
+
+        first = mecab.parse("나의 꿈")
+        assert first == mecab.parse("나의 꿈")
+        assert first[0].feature is not mecab.parse("나의 꿈")[0].feature
+        assert len(feature_cache) == 0
+    finally:
+        feature_cache.resize(65536)
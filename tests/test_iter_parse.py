@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from mecab import MeCab
+
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
+
+
+def readlines(path: Path) -> list[str]:
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_iter_parse_path(mecab: MeCab, memory_map: bool):
+    expected = mecab.parse_batch(readlines(corpus_path))
+    assert list(mecab.iter_parse(corpus_path, chunk_size=1000, memory_map=memory_map)) == expected
+
+
+def test_iter_parse_file(mecab: MeCab):
+    expected = mecab.parse_batch(readlines(corpus_path))
+
+    with open(corpus_path, "rb") as binary_file:
+        assert list(mecab.iter_parse(binary_file, chunk_size=1000)) == expected
+
+    with open(corpus_path, encoding="utf-8") as text_file:
+        assert list(mecab.iter_parse(text_file, chunk_size=1000)) == expected
+
+
+def test_iter_parse_iterable(mecab: MeCab):
+    sentences = ["나의 꿈은 맑은 바람이 되어서", "", "흙에서 자란 내 마음 파아란 하늘빛"] * 10
+    assert list(mecab.iter_parse(iter(sentences), chunk_size=10, number_of_threads=2)) == mecab.parse_batch(sentences)
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_iter_parse_file_offsets(mecab: MeCab, memory_map: bool):
+    content = corpus_path.read_bytes()
+
+    for morphemes in mecab.iter_parse(corpus_path, chunk_size=1000, memory_map=memory_map, file_offsets=True):
+        for morpheme in morphemes:
+            assert content[morpheme.span.start : morpheme.span.end].decode("utf-8") == morpheme.surface
+
+
+def test_iter_parse_crlf(mecab: MeCab):
+    source = io.BytesIO("나의 꿈\r\n\r\n하늘빛".encode("utf-8"))
+    assert list(mecab.iter_parse(source)) == [mecab.parse("나의 꿈"), [], mecab.parse("하늘빛")]
+
+
+def test_iter_parse_invalid_options(mecab: MeCab):
+    with pytest.raises(ValueError):
+        list(mecab.iter_parse(["나의 꿈"], memory_map=True))
+
+    with pytest.raises(ValueError):
+        list(mecab.iter_parse(["나의 꿈"], file_offsets=True))
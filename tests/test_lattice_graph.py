@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import _mecab
+from mecab import MeCab
+
+
+def walk(mecab: MeCab, sentence: str) -> set[tuple[int, int, str]]:
+    lattice = _mecab.Lattice()
+    lattice.set_request_type(_mecab.MECAB_ALL_MORPHS)
+    lattice.set_sentence(sentence)
+    assert mecab._tagger.parse(lattice)
+
+    encoded = sentence.encode("utf-8")
+    nodes = set()
+    for position in range(lattice.size()):
+        node = lattice.begin_nodes(position)
+        while node is not None:
+            start = len(encoded[: position + node.rlength - node.length].decode("utf-8"))
+            nodes.add((start, start + len(node.surface), node.feature.split(",")[0]))
+            node = node.bnext
+    return nodes
+
+
+def test_lattice_graph(mecab: MeCab):
+    sentence = "아버지가 방에 들어가신다"
+
+    graph = mecab.lattice_graph(sentence)
+    number_of_nodes = len(graph.starts)
+    assert (graph.stats[0], graph.stats[number_of_nodes - 1]) == (2, 3)
+    assert {
+        (graph.starts[index], graph.ends[index], graph.pos(index)) for index in range(1, number_of_nodes - 1)
+    } == walk(mecab, sentence)
+
+    best = [index for index in range(1, number_of_nodes - 1) if graph.best[index]]
+    expected = mecab.parse(sentence)
+    assert [(graph.starts[index], graph.ends[index], graph.pos(index)) for index in best] == [
+        (*morpheme.span, morpheme.pos) for morpheme in expected
+    ]
+    assert graph.costs[number_of_nodes - 1] == mecab.parse_nbest(sentence, 1)[0].cost
+
+
+def test_lattice_graph_paths(mecab: MeCab):
+    graph = mecab.lattice_graph("아버지가방에들어가신다")
+
+    assert len(graph.path_lefts) == len(graph.path_rights) == len(graph.path_costs) > 0
+    for left, right in zip(graph.path_lefts, graph.path_rights):
+        assert graph.ends[left] == graph.starts[right]
+
+    # Every node but BOS is reachable from a left node
+    assert set(graph.path_rights) == set(range(1, len(graph.starts)))
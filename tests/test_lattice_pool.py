@@ -0,0 +1,29 @@
+from mecab import MeCab
+from mecab.utils import LatticePool
+
+
+def test_lattice_pool():
+    pool = LatticePool(max_size=1, max_sentence_length=10)
+
+    first = pool.acquire("나의 꿈")
+    second = pool.acquire("나의 꿈")
+    assert first is not second
+    assert first.sentence() == "나의 꿈"
+
+    pool.release(first, "나의 꿈")
+    pool.release(second, "나의 꿈")
+    assert len(pool) == 1
+    assert pool.acquire("맑은 바람") is first
+
+    # A lattice used for a long sentence is not reused
+    pool.release(first, "맑은 바람" * 10)
+    assert len(pool) == 0
+
+
+def test_parse_with_lattice_pool():
+    mecab = MeCab(lattice_pool_size=1)
+    expected = MeCab(lattice_pool_size=0).parse("나의 꿈은 맑은 바람이 되어서")
+
+    for _ in range(3):
+        assert mecab.parse("나의 꿈은 맑은 바람이 되어서") == expected
+    assert len(mecab._lattice_pool) == 1
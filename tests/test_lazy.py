@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import mecab_ko_dic
+
+from mecab import MeCab, ResultCache, model_cache
+from mecab.mecab import _rcfile_option
+
+
+def test_lazy_import():
+    code = "import sys, mecab; print('asyncio' in sys.modules, 'mecab_ko_dic' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True)
+    assert output.stdout.split() == ["False", "False"]
+
+    from mecab import AsyncMeCab, build_user_dictionary
+
+    assert AsyncMeCab.__module__ == "mecab.aio"
+    assert build_user_dictionary.__module__ == "mecab.user_dictionary"
+
+
+def test_lazy():
+    # A dictionary path that no other instance uses
+    dictionary_path = f"{mecab_ko_dic.dictionary_path}{os.sep}{os.sep}"
+    options = [*_rcfile_option, "--dicdir", dictionary_path]
+
+    mecab = MeCab(dictionary_path=dictionary_path, lazy=True, cache=ResultCache())
+    assert model_cache.references(options) == 0
+
+    assert mecab.pos("나의 꿈") == MeCab().pos("나의 꿈")
+    assert model_cache.references(options) == 1
+    assert len(mecab.dictionary) == 1
+
+
+def test_warmup():
+    mecab = MeCab(lazy=True)
+    mecab.warmup().join()
+
+    assert "_tagger" in vars(mecab)
+    assert mecab.morphs("나의 꿈") == ["나", "의", "꿈"]
+
+
+def test_lazy_reload_user_dictionaries():
+    mecab = MeCab(lazy=True)
+    mecab.reload_user_dictionaries([])
+
+    assert "_tagger" not in vars(mecab)
+    assert len(mecab.dictionary) == 1
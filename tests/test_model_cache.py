@@ -0,0 +1,102 @@
+import gc
+import os
+import threading
+from pathlib import Path
+
+import mecab_ko_dic
+
+from mecab import Feature, MeCab, ModelCache, build_user_dictionary, model_cache
+from mecab.mecab import _rcfile_option
+
+
+def test_shared_model():
+    first = MeCab()
+    second = MeCab()
+
+    assert first._model is second._model
+    assert first._tagger is not second._tagger
+    assert first.pos("나의 꿈") == second.pos("나의 꿈")
+
+
+def test_release_and_evict():
+    # A dictionary path that no other instance uses
+    dictionary_path = f"{mecab_ko_dic.dictionary_path}{os.sep}"
+    options = [*_rcfile_option, "--dicdir", dictionary_path]
+
+    mecab = MeCab(dictionary_path=dictionary_path)
+    assert model_cache.references(options) == 1
+
+    model_cache.evict()
+    assert model_cache.references(options) == 1
+
+    del mecab
+    gc.collect()
+    assert model_cache.references(options) == 0
+
+    number_of_models = len(model_cache)
+    assert model_cache.evict() >= 1
+    assert len(model_cache) < number_of_models
+
+
+def test_release_by_garbage_collector():
+    options = [*_rcfile_option, "--dicdir", str(mecab_ko_dic.dictionary_path)]
+
+    mecab = MeCab()
+    mecab.morphs("나의 꿈")
+    mecab.cycle = mecab  # Released only by the garbage collector
+    references = model_cache.references(options)
+
+    def collect():
+        nonlocal mecab
+        with model_cache._locked():
+            # As if the garbage collector runs while the cache is locked
+            del mecab
+            gc.collect()
+
+    thread = threading.Thread(target=collect, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert model_cache.references(options) == references - 1
+
+
+def test_model_cache():
+    cache = ModelCache()
+    options = [*_rcfile_option, "--dicdir", str(mecab_ko_dic.dictionary_path)]
+
+    model = cache.acquire(options)
+    assert cache.acquire(options) is model
+    assert cache.references(options) == 2
+
+    cache.release(model)
+    assert cache.evict() == 0
+
+    cache.release(model)
+    assert cache.evict() == 1
+    assert len(cache) == 0
+
+
+def test_rebuilt_dictionary(tmp_path: Path):
+    dictionary_path = tmp_path / "user.dic"
+    options = [*_rcfile_option, "--dicdir", str(mecab_ko_dic.dictionary_path), "--userdic", f'"{dictionary_path}"']
+
+    build_user_dictionary([("트위치", Feature(pos="NNP", has_jongseong=False))], dictionary_path)
+    mecab = MeCab(user_dictionary_path=dictionary_path)
+    assert mecab.morphs("트위치 플랫폼") == ["트위치", "플랫", "폼"]
+    del mecab
+    gc.collect()
+
+    # Rebuilt at the same path
+    build_user_dictionary(
+        [("트위치", Feature(pos="NNP", has_jongseong=False)), ("플랫폼", Feature(pos="NNG", has_jongseong=True))],
+        dictionary_path,
+    )
+    assert model_cache.references(options) == 0
+
+    mecab = MeCab(user_dictionary_path=dictionary_path)
+    assert mecab.morphs("트위치 플랫폼") == ["트위치", "플랫폼"]
+    assert mecab.dictionary[1].number_of_words == 2
+    assert model_cache.references(options) == 1
+
+    # The model of the previous dictionary is not kept
+    assert sum(key[0] == tuple(options) for key in model_cache._entries) == 1
@@ -1,5 +1,10 @@
+from pathlib import Path
+
 from mecab import MeCab
 
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
+
 
 def test_morphs(mecab: MeCab):
     assert mecab.morphs("") == []
@@ -16,3 +21,8 @@ def test_morphs(mecab: MeCab):
         "되",
         "어서",
     ]
+
+
+def test_morphs_corpus(mecab: MeCab):
+    for line in corpus_path.read_text(encoding="utf-8").strip().splitlines():
+        assert mecab.morphs(line) == [morpheme.surface for morpheme in mecab.parse(line)]
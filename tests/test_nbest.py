@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+import _mecab
+from mecab import MeCab
+
+
+def enum_nbest(mecab: MeCab, sentence: str, n: int) -> list[list[tuple[str, str]]]:
+    lattice = _mecab.Lattice()
+    lattice.add_request_type(_mecab.MECAB_NBEST)
+    lattice.set_sentence(sentence)
+    assert mecab._tagger.parse(lattice)
+
+    candidates = []
+    for text in lattice.enum_nbest_as_string(n).split("EOS\n")[:-1]:
+        lines = [line.split("\t") for line in text.splitlines()]
+        candidates.append([(surface, feature) for surface, feature in lines])
+    return candidates
+
+
+def test_parse_nbest(mecab: MeCab):
+    sentence = "아버지가방에들어가신다"
+
+    candidates = mecab.parse_nbest(sentence, 5)
+    assert len(candidates) == 5
+    assert candidates[0].morphemes == mecab.parse(sentence)
+    assert [candidate.cost for candidate in candidates] == sorted(candidate.cost for candidate in candidates)
+
+    expected = enum_nbest(mecab, sentence, 5)
+    assert [
+        [(morpheme.surface, str(morpheme.feature)) for morpheme in candidate.morphemes] for candidate in candidates
+    ] == expected
+
+
+def test_parse_nbest_span(mecab: MeCab):
+    sentence = " 나의 꿈은 맑은 바람이 되어서"
+
+    for candidate in mecab.parse_nbest(sentence, 3):
+        for morpheme in candidate.morphemes:
+            assert sentence[morpheme.span.start : morpheme.span.end] == morpheme.surface
+
+
+def test_parse_nbest_request_type(mecab: MeCab):
+    expected = mecab.parse("하늘빛")
+
+    mecab.parse_nbest("하늘빛", 3)
+    assert mecab.parse("하늘빛") == expected
+
+
+def test_parse_nbest_invalid(mecab: MeCab):
+    with pytest.raises(ValueError):
+        mecab.parse_nbest("하늘빛", 0)
@@ -1,5 +1,10 @@
+from pathlib import Path
+
 from mecab import MeCab
 
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
+
 
 def test_nouns(mecab: MeCab):
     assert mecab.nouns("") == []
@@ -9,3 +14,8 @@ def test_nouns(mecab: MeCab):
         "꿈",
         "바람",
     ]
+
+
+def test_nouns_corpus(mecab: MeCab):
+    for line in corpus_path.read_text(encoding="utf-8").strip().splitlines():
+        assert mecab.nouns(line) == [morpheme.surface for morpheme in mecab.parse(line) if morpheme.pos.startswith("N")]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mecab import MeCab
+from mecab.parallel import Throughput, tokenize_corpus
+from mecab.types import Columns
+
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
+
+
+def readlines(path: Path) -> list[str]:
+    lines = path.read_text(encoding="utf-8").strip()
+    return lines.splitlines()
+
+
+def to_pos(columns: Columns) -> list[list[tuple[str, str]]]:
+    offsets = columns.sentence_offsets.tolist()
+    return [
+        [(columns.surface(index), columns.pos(index)) for index in range(start, end)]
+        for start, end in zip(offsets, offsets[1:])
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_tokenize_corpus(mecab: MeCab, workers: int):
+    lines = readlines(corpus_path)
+    progress = []
+
+    list_of_pos = []
+    for columns in tokenize_corpus(corpus_path, workers=workers, chunk_size=50, on_progress=progress.append):
+        list_of_pos.extend(to_pos(columns))
+
+    assert list_of_pos == mecab.pos_batch(lines)
+    assert progress[-1].sentences == len(lines)
+    assert progress[-1].bytes == sum(len(line.encode("utf-8")) for line in lines)
+    assert isinstance(progress[-1], Throughput)
+
+
+def test_tokenize_sentences(mecab: MeCab):
+    sentences = ["나의 꿈은 맑은 바람이 되어서", "", "흙에서 자란 내 마음 파아란 하늘빛"] * 10
+
+    list_of_pos = []
+    for columns in tokenize_corpus(iter(sentences), workers=2, chunk_size=4):
+        list_of_pos.extend(to_pos(columns))
+
+    assert list_of_pos == mecab.pos_batch(sentences)
+
+
+def test_tokenize_corpus_stopped_early():
+    chunks = tokenize_corpus([corpus_path, corpus_path], workers=2, chunk_size=10)
+    assert isinstance(next(chunks), Columns)
+    chunks.close()
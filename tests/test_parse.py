@@ -1,4 +1,10 @@
+from pathlib import Path
+
 from mecab import Feature, MeCab, Morpheme, Span
+from mecab.utils import create_lattice
+
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
 
 
 def test_parse(mecab: MeCab):
@@ -60,3 +66,25 @@ def test_parse(mecab: MeCab):
             ),
         ),
     ]
+
+
+def test_parse_span(mecab: MeCab):
+    assert mecab.parse("  나의 꿈") == [
+        Morpheme(span=Span(2, 3), surface="나", feature=Feature(pos="NP", has_jongseong=False, reading="나")),
+        Morpheme(span=Span(3, 4), surface="의", feature=Feature(pos="JKG", has_jongseong=False, reading="의")),
+        Morpheme(
+            span=Span(5, 6), surface="꿈", feature=Feature(pos="NNG", semantic="행위", has_jongseong=True, reading="꿈")
+        ),
+    ]
+
+    text = "나의 꿈은 맑은 바람이 되어서 " * 1000
+    for morpheme in mecab.parse(text):
+        assert text[morpheme.span.start : morpheme.span.end] == morpheme.surface
+
+
+def test_parse_native_feature(mecab: MeCab):
+    for line in corpus_path.read_text(encoding="utf-8").strip().splitlines():
+        lattice = create_lattice(line)
+        assert mecab._tagger.parse(lattice)
+
+        assert mecab.parse(line) == [Morpheme._from_node(span, node) for span, node in lattice]
@@ -1,5 +1,10 @@
+from pathlib import Path
+
 from mecab import MeCab
 
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
+
 
 def test_pos(mecab: MeCab):
     assert mecab.pos("") == []
@@ -16,3 +21,8 @@ def test_pos(mecab: MeCab):
         ("되", "VV"),
         ("어서", "EC"),
     ]
+
+
+def test_pos_corpus(mecab: MeCab):
+    for line in corpus_path.read_text(encoding="utf-8").strip().splitlines():
+        assert mecab.pos(line) == [(morpheme.surface, morpheme.pos) for morpheme in mecab.parse(line)]
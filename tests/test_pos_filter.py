@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+import pytest
+
+from mecab import MeCab, pos_registry
+
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
+
+
+def readlines(path: Path) -> list[str]:
+    lines = path.read_text(encoding="utf-8").strip()
+    return lines.splitlines()
+
+
+def select(pos: str, include_pos: list[str], exclude_pos: list[str]) -> bool:
+    if include_pos and not any(pos.startswith(prefix) for prefix in include_pos):
+        return False
+    return not any(pos.startswith(prefix) for prefix in exclude_pos)
+
+
+@pytest.mark.parametrize(
+    "include_pos, exclude_pos",
+    [(["N", "V"], []), ([], ["J", "E", "S"]), (["N"], ["NNB"])],
+)
+def test_pos_filter(mecab: MeCab, include_pos: list[str], exclude_pos: list[str]):
+    lines = readlines(corpus_path)[:50]
+    expected = [
+        [morpheme for morpheme in mecab.parse(line) if select(morpheme.pos, include_pos, exclude_pos)] for line in lines
+    ]
+
+    assert [mecab.parse(line, include_pos=include_pos, exclude_pos=exclude_pos) for line in lines] == expected
+    assert mecab.parse_batch(lines, include_pos=include_pos, exclude_pos=exclude_pos, number_of_threads=2) == expected
+    assert mecab.pos_batch(lines, include_pos=include_pos, exclude_pos=exclude_pos) == [
+        [(morpheme.surface, morpheme.pos) for morpheme in morphemes] for morphemes in expected
+    ]
+    assert mecab.morphs(lines[0], include_pos=include_pos, exclude_pos=exclude_pos) == [
+        morpheme.surface for morpheme in expected[0]
+    ]
+
+
+def test_pos_filter_single_tag(mecab: MeCab):
+    sentence = "아버지가 방에 들어가신다."
+
+    assert mecab.pos(sentence, exclude_pos="J") == [
+        ("아버지", "NNG"),
+        ("방", "NNG"),
+        ("들어가", "VV"),
+        ("신다", "EP+EF"),
+        (".", "SF"),
+    ]
+    assert mecab.morphs(sentence, include_pos="N") == mecab.nouns(sentence)
+
+
+def test_pos_filter_columnar(mecab: MeCab):
+    lines = readlines(corpus_path)[:20]
+
+    columns = mecab.parse_columnar(lines, exclude_pos=["J", "E"])
+    expected = mecab.pos_batch(lines, exclude_pos=["J", "E"])
+    assert [columns.pos(index) for index in range(len(columns.starts))] == [
+        pos for pairs in expected for _, pos in pairs
+    ]
+
+
+def test_pos_registry(mecab: MeCab):
+    assert pos_registry.tag(pos_registry.id("NNG")) == "NNG"
+    assert pos_registry.id("NNG") == pos_registry.tags().index("NNG")
+
+    sentence = "아버지가 방에 들어가신다"
+    columns = mecab.parse_columnar([sentence])
+    assert columns.pos_tags == pos_registry.tags()
+    assert [pos_registry.tag(id) for id in columns.pos_ids] == [pos for _, pos in mecab.pos(sentence)]
+
+    tag = f"NNG+{uuid.uuid4().hex}"
+    assert tag not in pos_registry.tags()
+    assert pos_registry.id(tag) == len(pos_registry) - 1
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from mecab import Feature, MeCab, ResultCache, build_user_dictionary
+
+
+def test_result_cache(mecab: MeCab):
+    cache = ResultCache()
+    mecab_with_cache = MeCab(cache=cache)
+
+    sentence = "아버지가방에들어가신다"
+    assert mecab_with_cache.parse(sentence) == mecab.parse(sentence)
+    assert mecab_with_cache.parse(sentence) == mecab.parse(sentence)
+    assert mecab_with_cache.nouns(sentence) == mecab.nouns(sentence)
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.entries) == (1, 2, 2)
+
+
+def test_result_cache_shared():
+    cache = ResultCache()
+    first, second = MeCab(cache=cache), MeCab(cache=cache)
+
+    morphs = first.morphs("나의 꿈은 맑은 바람이 되어서")
+    morphs.append("!")  # Results are copied from the cache
+    assert second.morphs("나의 꿈은 맑은 바람이 되어서") == morphs[:-1]
+    assert cache.info().hits == 1
+
+
+def test_result_cache_eviction():
+    cache = ResultCache(max_entries=2)
+    mecab = MeCab(cache=cache)
+
+    for sentence in ["하나", "둘", "셋", "하나"]:
+        mecab.morphs(sentence)
+    assert len(cache) == 2
+    assert cache.info().misses == 4
+
+    cache = ResultCache(max_entries=None, max_bytes=4096)
+    mecab = MeCab(cache=cache)
+    for index in range(100):
+        mecab.parse(f"{index}번째 문장입니다")
+    assert 0 < cache.info().bytes <= 4096
+    assert cache.info().evictions > 0
+
+
+def test_result_cache_ttl():
+    cache = ResultCache(ttl=0)
+    mecab = MeCab(cache=cache)
+
+    mecab.morphs("하늘빛")
+    mecab.morphs("하늘빛")
+    assert cache.info().hits == 0
+
+
+def test_result_cache_rebuilt_dictionary(tmp_path: Path):
+    dictionary_path = tmp_path / "user.dic"
+    cache = ResultCache()
+
+    build_user_dictionary([("트위치", Feature(pos="NNP", has_jongseong=False))], dictionary_path)
+    previous = MeCab(user_dictionary_path=dictionary_path, cache=cache)
+    assert previous.morphs("트위치 플랫폼") == ["트위치", "플랫", "폼"]
+
+    # Rebuilt at the same path while the previous dictionary is still loaded
+    build_user_dictionary(
+        [("트위치", Feature(pos="NNP", has_jongseong=False)), ("플랫폼", Feature(pos="NNG", has_jongseong=True))],
+        dictionary_path,
+    )
+    current = MeCab(user_dictionary_path=dictionary_path, cache=cache)
+    assert current.morphs("트위치 플랫폼") == ["트위치", "플랫폼"]
+    assert previous.morphs("트위치 플랫폼") == ["트위치", "플랫", "폼"]
+    assert cache.info().hits == 1
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from mecab import MeCab
+
+
+def test_stats():
+    mecab = MeCab(instrument=True)
+
+    morphemes = mecab.parse("아버지가방에들어가신다")
+    stats = mecab.stats()
+    assert stats.sentences == 1
+    assert stats.bytes == len("아버지가방에들어가신다".encode("utf-8"))
+    assert stats.nodes == len(morphemes)
+    assert stats.unknown_nodes == 0
+    assert stats.calls == {"lattice": 1, "analysis": 1, "conversion": 1}
+
+
+def test_stats_batch():
+    mecab = MeCab(instrument=True)
+    sentences = ["나의 꿈은 맑은 바람이 되어서", "ㆍ경제ㆍ사회ㆍ"]
+
+    mecab.nouns_batch(sentences)
+    stats = mecab.stats()
+    assert stats.sentences == 2
+    assert stats.bytes == sum(len(sentence.encode("utf-8")) for sentence in sentences)
+    assert stats.nodes == sum(len(morphemes) for morphemes in mecab.parse_batch(sentences))
+    assert stats.unknown_nodes > 0
+    assert stats.calls == {"batch": 1}
+
+    mecab.reset_stats()
+    assert mecab.stats().sentences == 0
+
+
+def test_stats_to_prometheus():
+    mecab = MeCab(instrument=True)
+    mecab.parse("하늘빛")
+
+    exposition = mecab.stats().to_prometheus()
+    assert "mecab_sentences_total 1\n" in exposition
+    assert 'mecab_stage_calls_total{stage="analysis"} 1\n' in exposition
+
+
+def test_stats_disabled(mecab: MeCab):
+    with pytest.raises(RuntimeError):
+        mecab.stats()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from mecab import MeCab
+from mecab.utils import create_lattice
+
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
+
+
+def readlines(path: Path) -> list[str]:
+    lines = path.read_text(encoding="utf-8").strip()
+    return lines.splitlines()
+
+
+def test_parse_from_multiple_threads(mecab: MeCab):
+    lines = readlines(corpus_path)
+    expected = [mecab.parse(line) for line in lines]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(mecab.parse, lines)) == expected
+
+
+def test_parse_releases_gil(mecab: MeCab):
+    lattice = create_lattice(" ".join(readlines(corpus_path) * 4))
+    analysis = []
+
+    def parse():
+        start = time.perf_counter()
+        assert mecab._tagger.parse(lattice)
+        analysis.extend([start, time.perf_counter()])
+
+    timestamps = []
+    thread = threading.Thread(target=parse)
+    thread.start()
+    while thread.is_alive():
+        timestamps.append(time.perf_counter())
+    thread.join()
+
+    # This thread keeps running in the middle of the analysis only if the GIL is released
+    start, end = analysis
+    margin = (end - start) / 4
+    assert any(start + margin < timestamp < end - margin for timestamp in timestamps)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mecab import MeCab
+from mecab.__main__ import mecab_tokenize
+
+tests_path = Path(__file__).parent.absolute()
+corpus_path = tests_path / "corpus.txt"
+
+
+def readlines(path: Path) -> list[str]:
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def test_tokenize_jsonl(mecab: MeCab, tmp_path: Path):
+    output_path = tmp_path / "output.jsonl"
+    assert mecab_tokenize([str(corpus_path), "-o", str(output_path), "-t", "2", "-c", "100", "-q"]) == 0
+
+    expected = [[[surface, pos] for surface, pos in result] for result in mecab.pos_batch(readlines(corpus_path))]
+    assert [json.loads(line) for line in readlines(output_path)] == expected
+
+
+def test_tokenize_tsv(mecab: MeCab, tmp_path: Path):
+    output_path = tmp_path / "output.tsv"
+    assert mecab_tokenize([str(corpus_path), "-o", str(output_path), "-f", "tsv", "-q"]) == 0
+
+    sentences = output_path.read_text(encoding="utf-8").split("\n\n")[:-1]
+    expected = mecab.pos_batch(readlines(corpus_path))
+    assert [[tuple(line.split("\t")) for line in sentence.splitlines()] for sentence in sentences] == expected
+
+
+@pytest.mark.parametrize("format", ["jsonl", "columnar"])
+def test_tokenize_processes(tmp_path: Path, format: str):
+    for name, option in [("threads", "-t"), ("processes", "-p")]:
+        output_path = tmp_path / name
+        assert (
+            mecab_tokenize([str(corpus_path), "-o", str(output_path), "-f", format, option, "2", "-c", "50", "-q"]) == 0
+        )
+
+    assert (tmp_path / "threads").read_bytes() == (tmp_path / "processes").read_bytes()
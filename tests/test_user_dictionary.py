@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import subprocess
 import sys
+import threading
 import uuid
 from pathlib import Path
 from typing import NamedTuple, Optional
 
 import pytest
 
-from mecab import Feature, MeCab
+from mecab import Feature, MeCab, ResultCache, model_cache
 
 
 class Morpheme(NamedTuple):
@@ -128,3 +129,73 @@ def test_multiple_user_dictionary(mecab: MeCab, twitch_user_dictionary_path: Pat
         ("플랫폼", "NNG"),
         ("입니다", "VCP+EC"),
     ]
+
+
+def test_user_dictionary_result_cache(twitch_user_dictionary_path: Path):
+    cache = ResultCache()
+
+    assert MeCab(cache=cache).morphs("트위치") == ["트", "위치"]
+    assert MeCab(user_dictionary_path=twitch_user_dictionary_path, cache=cache).morphs("트위치") == ["트위치"]
+    assert cache.info().hits == 0
+
+
+def test_reload_user_dictionaries(mecab: MeCab, twitch_user_dictionary_path: Path, platform_user_dictionary_path: Path):
+    mecab_with_user_dictionary = MeCab(cache=ResultCache())
+    assert mecab_with_user_dictionary.morphs("트위치 플랫폼") == ["트", "위치", "플랫", "폼"]
+
+    mecab_with_user_dictionary.reload_user_dictionaries(twitch_user_dictionary_path)
+    assert len(mecab_with_user_dictionary.dictionary) == 2
+    assert mecab_with_user_dictionary.morphs("트위치 플랫폼") == ["트위치", "플랫", "폼"]
+    assert mecab.morphs("트위치 플랫폼") == ["트", "위치", "플랫", "폼"]
+
+    previous_options = mecab_with_user_dictionary._options
+    mecab_with_user_dictionary.reload_user_dictionaries([twitch_user_dictionary_path, platform_user_dictionary_path])
+    assert len(mecab_with_user_dictionary.dictionary) == 3
+    assert mecab_with_user_dictionary.morphs("트위치 플랫폼") == ["트위치", "플랫폼"]
+    assert model_cache.references(previous_options) == 0
+
+    mecab_with_user_dictionary.reload_user_dictionaries(None)
+    assert len(mecab_with_user_dictionary.dictionary) == 1
+    assert mecab_with_user_dictionary.morphs("트위치 플랫폼") == ["트", "위치", "플랫", "폼"]
+
+
+def test_reload_user_dictionaries_rebuilt(tmp_path: Path):
+    dictionary_path = tmp_path / "user.dic"
+    twitch = Morpheme("트위치", Feature(pos="NNP", has_jongseong=False))
+    platform = Morpheme("플랫폼", Feature(pos="NNG", has_jongseong=True))
+
+    build_user_dictionary([twitch], tmp_path).replace(dictionary_path)
+
+    mecab = MeCab(user_dictionary_path=dictionary_path, cache=ResultCache())
+    assert mecab.morphs("트위치 플랫폼") == ["트위치", "플랫", "폼"]
+    assert mecab.dictionary[1].number_of_words == 1
+
+    # Rebuilt at the same path
+    build_user_dictionary([twitch, platform], tmp_path).replace(dictionary_path)
+
+    mecab.reload_user_dictionaries(dictionary_path)
+    assert mecab.morphs("트위치 플랫폼") == ["트위치", "플랫폼"]
+    assert mecab.dictionary[1].number_of_words == 2
+    assert model_cache.references(mecab._options) == 1
+
+
+def test_reload_user_dictionaries_while_parsing(twitch_user_dictionary_path: Path):
+    mecab = MeCab()
+    stopped = threading.Event()
+    results = set()
+
+    def parse():
+        while not stopped.is_set():
+            results.add(tuple(mecab.morphs("트위치")))
+
+    thread = threading.Thread(target=parse)
+    thread.start()
+    try:
+        for _ in range(5):
+            mecab.reload_user_dictionaries(twitch_user_dictionary_path)
+            mecab.reload_user_dictionaries(None)
+    finally:
+        stopped.set()
+        thread.join()
+
+    assert results <= {("트", "위치"), ("트위치",)}